@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Wordle Combinations Finder hot paths
+Times word checking, filtering, ranking, suggestions, rendering and word-list
+loading on the shipped list and on seeded synthetic corpora, writes the results
+as JSON and can compare them against a stored baseline to flag regressions
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+# The solver engine is the shared wordle_core package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..'))
+
+import wordle_core as core
+import wordle_combo_finder as finder
+from wordle_core.suggest import _bound_guesses
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_HISTORIES = [1, 2, 3, 4, 5, 6]
+
+# Cases whose work estimate exceeds these budgets are recorded as skipped
+# rather than left running for hours
+MAX_RANK_CANDIDATES = 2_000_000
+MAX_SUGGEST_CELLS = 50_000_000     # guesses actually scored x candidates
+MAX_RENDER_CANDIDATES = 200_000
+
+
+def synthetic_corpus(size: int, seed: int) -> List[str]:
+    """Random 5-letter words drawn from the shipped list's per-position letter frequencies."""
+    rng = random.Random(seed)
+    words = core.pattern_words(core.load_word_list())
+    columns = []
+    for pos in range(5):
+        freq = Counter(word[pos] for word in words)
+        letters = sorted(freq)
+        columns.append(rng.choices(letters, weights=[freq[l] for l in letters], k=size))
+    return [''.join(letters) for letters in zip(*columns)]
+
+
+def make_history(corpus: List[str], depth: int, seed: int):
+    """A seeded answer plus depth guesses with the feedback they would really get."""
+    rng = random.Random(seed)
+    playable = core.pattern_words(corpus)
+    answer = rng.choice(playable)
+    guesses = rng.sample(playable, depth)
+    return guesses, [core.score_feedback(guess, answer) for guess in guesses]
+
+
+def time_case(func: Callable, batch: int = 1, min_time: float = 0.5, min_runs: int = 3, max_runs: int = 200) -> Dict:
+    """Run func repeatedly; return ops/sec and per-op latency percentiles."""
+    func()   # warm caches (indexes, matrices) outside the measurement
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < min_runs or (time.perf_counter() - started < min_time and len(samples) < max_runs):
+        t = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - t) / batch)
+    samples.sort()
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(p / 100 * len(samples)))] * 1000
+
+    total = sum(samples)
+    return {
+        'runs': len(samples),
+        'ops_per_sec': len(samples) / total if total else float('inf'),
+        'mean_ms': total / len(samples) * 1000,
+        'p50_ms': percentile(50),
+        'p90_ms': percentile(90),
+        'p99_ms': percentile(99),
+    }
+
+
+def run_benchmarks(sizes: List[int], histories: List[int], seed: int, min_time: float, progress=None) -> List[Dict]:
+    results = []
+
+    def record(name, corpus_name, depth, func, batch=1, skip_reason=None):
+        entry = {'name': name, 'corpus': corpus_name, 'history': depth}
+        if skip_reason:
+            entry['skipped'] = skip_reason
+        else:
+            entry.update(time_case(func, batch, min_time))
+        results.append(entry)
+        if progress is not None:
+            progress(entry)
+
+    record('load_word_list[parse]', 'shipped', 0, lambda: core.parse_word_file(core.DEFAULT_WORDLIST))
+    record('load_word_list[cache]', 'shipped', 0, core.load_word_list)
+
+    corpora = [('shipped', core.load_word_list())]
+    corpora += [(f'synthetic-{size}', synthetic_corpus(size, seed + size)) for size in sizes]
+
+    for corpus_name, corpus in corpora:
+        build = lambda: core.WordIndex(corpus)
+        record('WordIndex build', corpus_name, 0, build,
+               skip_reason=None if len(corpus) <= 200_000 else 'corpus too large for repeated builds')
+
+        for depth in histories:
+            guesses, feedbacks = make_history(corpus, depth, seed + depth)
+            candidates = core.filter_words(guesses, feedbacks, corpus)
+
+            pairs = [(word, guesses[-1], feedbacks[-1]) for word in corpus[:1000]]
+            record('is_valid_word', corpus_name, depth,
+                   lambda: [core.is_valid_word(*pair) for pair in pairs], batch=len(pairs))
+
+            record('filter_words[bitset]', corpus_name, depth,
+                   lambda: core.filter_words(guesses, feedbacks, corpus))
+            record('filter_words[numpy]', corpus_name, depth,
+                   lambda: core.filter_words(guesses, feedbacks, corpus, backend='numpy'),
+                   skip_reason=None if core.NUMPY_VERSION else 'numpy not installed')
+
+            record('rank_words_by_relevance', corpus_name, depth,
+                   lambda: core.rank_words_by_relevance(candidates, candidates),
+                   skip_reason=None if len(candidates) <= MAX_RANK_CANDIDATES else f'{len(candidates)} candidates')
+            record('rank_words_by_relevance[top20]', corpus_name, depth,
+                   lambda: core.rank_words_by_relevance(candidates, candidates, top_k=20),
+                   skip_reason=None if len(candidates) <= MAX_RANK_CANDIDATES else f'{len(candidates)} candidates')
+
+            # Without numpy and the pattern matrix the search only scores a bounded set of guesses
+            answers = core.pattern_words(candidates)
+            cells = len(_bound_guesses(core.pattern_words(corpus), answers, corpus, None)) * len(answers)
+            record('suggest_next_guess', corpus_name, depth,
+                   lambda: core.suggest_next_guess(candidates, corpus),
+                   skip_reason=None if cells <= MAX_SUGGEST_CELLS else f'{cells} guess x candidate cells')
+            # Repeated game state: after the first call every lookup hits the in-memory cache
+            cache = core.SuggestionCache()
+            record('suggest_next_guess[cached]', corpus_name, depth,
+                   lambda: core.suggest_next_guess(candidates, corpus, cache=cache),
+                   skip_reason=None if cells <= MAX_SUGGEST_CELLS else f'{cells} guess x candidate cells')
+
+            def render():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    finder.display_possible_words(candidates)
+            record('display_possible_words', corpus_name, depth, render,
+                   skip_reason=None if len(candidates) <= min(MAX_RENDER_CANDIDATES, MAX_RANK_CANDIDATES)
+                   else f'{len(candidates)} candidates')
+
+    return results
+
+
+def compare(results: List[Dict], baseline: List[Dict], threshold: float) -> List[str]:
+    """Describe every case whose median latency got worse than threshold (a fraction)."""
+    previous = {(r['name'], r['corpus'], r['history']): r for r in baseline if 'p50_ms' in r}
+    regressions = []
+    for result in results:
+        old = previous.get((result['name'], result['corpus'], result['history']))
+        if old is None or 'p50_ms' not in result or not old['p50_ms']:
+            continue
+        change = result['p50_ms'] / old['p50_ms'] - 1
+        if change > threshold:
+            regressions.append(f"{result['name']} [{result['corpus']}, {result['history']} guesses]: "
+                               f"p50 {old['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms (+{change:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the finder's hot paths.")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON results file")
+    parser.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES,
+                        help="Synthetic corpus sizes (default: 10k 100k 1M)")
+    parser.add_argument('--histories', type=int, nargs='*', default=DEFAULT_HISTORIES,
+                        help="Guess-history depths to run (default: 1-6)")
+    parser.add_argument('--seed', type=int, default=1234, help="Seed for corpora and histories")
+    parser.add_argument('--min-time', type=float, default=0.5, help="Seconds to spend per case")
+    parser.add_argument('--quick', action='store_true', help="Shipped list and 10k corpus, 1 and 3 guesses")
+    parser.add_argument('--compare', metavar='BASELINE', help="Flag regressions against a stored results file")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Median slowdown that counts as a regression (default: 0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.sizes, args.histories = [10_000], [1, 3]
+
+    def progress(entry):
+        detail = f"skipped: {entry['skipped']}" if 'skipped' in entry else \
+            f"{entry['ops_per_sec']:12.1f} ops/s  p50 {entry['p50_ms']:9.3f} ms"
+        print(f"  {entry['name']:<32} {entry['corpus']:<18} {entry['history']}  {detail}")
+
+    results = run_benchmarks(args.sizes, args.histories, args.seed, args.min_time, progress)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': core.NUMPY_VERSION,
+            'seed': args.seed,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"✓ No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Opening Book Builder for the Wordle Combinations Finder
+Solves the first turns of the game for the word list and saves the suggestion
+tree, so the finder can answer those turns with a lookup instead of a search
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# The solver engine is the shared wordle_core package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..'))
+
+from wordle_core import BUCKET_STRATEGIES, DEFAULT_OPENING_BOOK, build_opening_book, load_word_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the opening book for the v5 finder.")
+    parser.add_argument('output', nargs='?', default=DEFAULT_OPENING_BOOK,
+                        help="Output file (default: opening_book.bin in wordle_core)")
+    parser.add_argument('--strategy', choices=BUCKET_STRATEGIES, default='entropy',
+                        help="Suggestion strategy to solve with (default: entropy)")
+    parser.add_argument('--depth', type=int, default=3,
+                        help="Number of turns to precompute (default: 3)")
+    parser.add_argument('--wordlist', metavar='FILE', help="Dictionary file (default: as the finder loads it)")
+    args = parser.parse_args()
+    
+    def progress(level, guess, children):
+        if level == 0:
+            print(f"  opening {guess.upper()}: {children} feedback branches")
+    
+    print(f"Building {args.depth}-turn opening book ({args.strategy})...")
+    start = time.perf_counter()
+    book = build_opening_book(load_word_list(args.wordlist), args.strategy, args.depth, progress)
+    book.save(args.output)
+    
+    print(f"✓ Saved opening book to {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
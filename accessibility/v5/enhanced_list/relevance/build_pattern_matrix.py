@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Pattern Matrix Builder for the Wordle Combinations Finder
+Precomputes the feedback code of every (guess, answer) pair in the word list
+and saves the N x N matrix to disk for entropy suggestions and simulations
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# The solver engine is the shared wordle_core package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..'))
+
+from wordle_core import (DEFAULT_PATTERN_MATRIX, build_pattern_matrix_parallel, load_word_list, pattern_words,
+                         save_pattern_matrix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the guess x answer feedback-pattern matrix.")
+    parser.add_argument('output', nargs='?', default=DEFAULT_PATTERN_MATRIX,
+                        help="Output file (default: pattern_matrix.bin in wordle_core)")
+    parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                        help="Worker processes (default: all cores, 1 builds in this process)")
+    parser.add_argument('--wordlist', metavar='FILE', help="Dictionary file (default: as the finder loads it)")
+    args = parser.parse_args()
+    
+    words = pattern_words(load_word_list(args.wordlist))
+    print(f"Building {len(words)} x {len(words)} pattern matrix with {args.processes} process(es)...")
+    
+    def progress(done, total):
+        print(f"\r  {done}/{total} rows", end='', flush=True)
+    
+    start = time.perf_counter()
+    matrix = build_pattern_matrix_parallel(words, args.processes, progress=progress)
+    save_pattern_matrix(args.output, words, matrix)
+    
+    print(f"\n✓ Saved {len(matrix) / 1e6:.1f} MB to {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Word List Sanitizer for the Wordle Combinations Finder
+Normalizes case and Unicode, drops duplicates, wrong-length and non-alphabetic
+entries, and writes the clean list back out with a report of what was removed
+"""
+
+import argparse
+import os
+import sys
+
+# The solver engine is the shared wordle_core package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..'))
+
+from wordle_core import DEFAULT_WORDLIST, WORD_LENGTH, parse_word_file, sanitize_words
+
+WORDS_PER_LINE = 10
+
+
+def format_quoted(words):
+    """Lay words out like wordlist.txt: indented, quoted, ten to a line."""
+    lines = []
+    for i in range(0, len(words), WORDS_PER_LINE):
+        lines.append('        ' + ', '.join(f'"{word}"' for word in words[i:i + WORDS_PER_LINE]) + ',')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean a word list for the finder.")
+    parser.add_argument('input', nargs='?', default=DEFAULT_WORDLIST,
+                        help="Word list to clean (default: the repository's wordlist.txt)")
+    parser.add_argument('-o', '--output', help="Where to write the clean list (default: stdout)")
+    parser.add_argument('--in-place', action='store_true', help="Overwrite the input file")
+    parser.add_argument('--length', type=int, default=WORD_LENGTH, help="Word length to keep (default: 5)")
+    parser.add_argument('--lines', action='store_true', help="Write one word per line instead of quoted")
+    parser.add_argument('--check', action='store_true',
+                        help="Only report; exit 1 if anything would be dropped or normalized")
+    args = parser.parse_args()
+
+    words, report = sanitize_words(parse_word_file(args.input), args.length)
+
+    # The report goes to stderr so stdout can be redirected to a file
+    for line in report.lines():
+        print(line, file=sys.stderr)
+
+    if args.check:
+        sys.exit(1 if report.kept != report.total or report.normalized else 0)
+
+    text = '\n'.join(words) + '\n' if args.lines else format_quoted(words)
+    output = args.input if args.in_place else args.output
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"✓ Wrote {len(words)} words to {output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Self-Play Simulation for the Wordle Combinations Finder
+Plays every dictionary word as the hidden answer with a suggestion strategy
+and reports the guess distribution, average, failures and games per second
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+from typing import Dict, List, Tuple
+
+# The solver engine is the shared wordle_core package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..'))
+
+from wordle_core import (SUGGESTION_STRATEGIES, SolverSession, load_word_list, pattern_words, score_feedback,
+                         suggest_for_history)
+
+MAX_TURNS = 12      # games are cut off here; anything over 6 counts as a failure
+WORDLE_TURNS = 6
+
+_worker = {}
+
+
+def _init_worker(strategy: str, hard_mode: bool, word_list_path: str = None):
+    _worker['word_list'] = load_word_list(word_list_path)
+    _worker['strategy'] = strategy
+    _worker['hard_mode'] = hard_mode
+    # Early turns repeat across games, so each worker remembers the first
+    # suggestion for every history it has already seen
+    _worker['memo'] = {}
+
+
+def play_game(answer: str, word_list: List[str], strategy: str = 'entropy', hard_mode: bool = False,
+              memo: Dict[Tuple[str, ...], str] = None) -> int:
+    """Play one game against a known answer; return the number of guesses (MAX_TURNS + 1 if unsolved)."""
+    session = SolverSession(word_list)
+    memo = {} if memo is None else memo
+
+    for turn in range(1, MAX_TURNS + 1):
+        key = tuple(session.guesses) + tuple(session.feedbacks)
+        guess = memo.get(key)
+        if guess is None:
+            candidates = session.candidates
+            playable = pattern_words(candidates)
+            if not playable:
+                break
+            # Only the frequency strategy reads the letter analysis
+            analysis = session.analysis if strategy == 'frequency' else None
+            suggestions = suggest_for_history(session.guesses, session.feedbacks, candidates,
+                                              word_list, strategy, hard_mode, analysis=analysis,
+                                              constraint=session.constraint)
+            # Only real 5-letter words can be played
+            guess = (pattern_words(suggestions) or playable)[0]
+            memo[key] = guess
+
+        if guess == answer:
+            return turn
+        session.add_guess(guess, score_feedback(guess, answer))
+
+    return MAX_TURNS + 1
+
+
+def _play(answer: str) -> Tuple[str, int]:
+    return answer, play_game(answer, _worker['word_list'], _worker['strategy'], _worker['hard_mode'],
+                             _worker['memo'])
+
+
+def simulate(answers: List[str], strategy: str = 'entropy', hard_mode: bool = False,
+             processes: int = None, progress=None, word_list_path: str = None) -> Dict[str, int]:
+    """Play every answer, spread across a process pool; return answer -> guesses used."""
+    results = {}
+    if processes == 1:
+        _init_worker(strategy, hard_mode, word_list_path)
+        games = map(_play, answers)
+        for answer, turns in games:
+            results[answer] = turns
+            if progress is not None:
+                progress(len(results), len(answers))
+        return results
+
+    with Pool(processes, initializer=_init_worker, initargs=(strategy, hard_mode, word_list_path)) as pool:
+        for answer, turns in pool.imap_unordered(_play, answers, chunksize=16):
+            results[answer] = turns
+            if progress is not None:
+                progress(len(results), len(answers))
+    return results
+
+
+def print_report(results: Dict[str, int], elapsed: float):
+    """Print the guess distribution and summary numbers."""
+    distribution = Counter(results.values())
+    games = len(results)
+    failures = sorted(answer for answer, turns in results.items() if turns > WORDLE_TURNS)
+    solved = [turns for turns in results.values() if turns <= MAX_TURNS]
+
+    print(f"\nGuess distribution ({games} games):")
+    for turns in sorted(distribution):
+        label = f"{turns:>3}" if turns <= MAX_TURNS else "  X"
+        count = distribution[turns]
+        print(f"  {label}: {count:5d} {'#' * max(1, round(60 * count / games))}")
+
+    if solved:
+        print(f"\nAverage guesses: {sum(solved) / len(solved):.3f}")
+    print(f"Failures (over {WORDLE_TURNS} guesses): {len(failures)}")
+    if failures:
+        print(f"  {', '.join(word.upper() for word in failures[:20])}{' ...' if len(failures) > 20 else ''}")
+    print(f"Games per second: {games / elapsed:.1f} ({elapsed:.1f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every dictionary word as the answer and report the results.")
+    parser.add_argument('--strategy', choices=SUGGESTION_STRATEGIES, default='entropy',
+                        help="Suggestion strategy to play with (default: entropy)")
+    parser.add_argument('--hard', action='store_true', help="Play in hard mode")
+    parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                        help="Worker processes (default: all cores, 1 plays in this process)")
+    parser.add_argument('--limit', type=int, default=None,
+                        help="Only play the first N answers (for quick checks)")
+    parser.add_argument('--wordlist', metavar='FILE', help="Dictionary file (default: as the finder loads it)")
+    args = parser.parse_args()
+
+    answers = pattern_words(load_word_list(args.wordlist))[:args.limit]
+    print(f"Simulating {len(answers)} games ({args.strategy}{', hard mode' if args.hard else ''}) "
+          f"with {args.processes} process(es)...")
+
+    def progress(done, total):
+        if done % 100 == 0 or done == total:
+            print(f"\r  {done}/{total} games", end='', flush=True)
+
+    start = time.perf_counter()
+    results = simulate(answers, args.strategy, args.hard, args.processes, progress, args.wordlist)
+    print_report(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Cross-checks for the Wordle solver core: every fast path against the plain
+Python reference it replaces
+"""
+
+from itertools import product
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import wordle_core
+from wordle_core.constraints import CompiledConstraint, MergedConstraint, filter_words
+from wordle_core.feedback import encode_feedback, feedback_code, score_feedback
+
+
+def _random_words(seed: int, count: int, alphabet: str = 'aeilnorst', length: int = 5) -> list:
+    """count distinct words over a small alphabet, so repeated letters are common."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice(alphabet) for _ in range(length)))
+    return sorted(words)
+
+
+def _random_history(rng: random.Random, words: list, turns: int):
+    """Guesses scored against a random answer, or (half the time) random G/Y/R strings."""
+    guesses = [rng.choice(words) for _ in range(turns)]
+    if rng.random() < 0.5:
+        return guesses, [''.join(rng.choice('GYR') for _ in guess) for guess in guesses]
+    answer = rng.choice(words)
+    return guesses, [score_feedback(guess, answer) for guess in guesses]
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('length', [5, 6])
+def test_filter_backends_match_reference(seed, length):
+    words = _random_words(seed, 600, 'aeirst', length)
+    mixed = sorted(words + _random_words(seed, 300, 'aeirst', 11 - length))
+    rng = random.Random(seed)
+    for turns in (1, 1, 2, 2, 3):
+        guesses, feedbacks = _random_history(rng, words, turns)
+        compiled = [CompiledConstraint(g, f) for g, f in zip(guesses, feedbacks)]
+        expected = [word for word in mixed if all(c.matches(word) for c in compiled)]
+        assert all(len(word) == length for word in expected)
+
+        assert filter_words(guesses, feedbacks, mixed) == expected
+        merged = MergedConstraint(guesses, feedbacks)
+        assert [word for word in mixed if merged.matches(word)] == expected
+        if wordle_core.NUMPY_VERSION is not None:
+            assert filter_words(guesses, feedbacks, mixed, backend='numpy') == expected
+
+
+def test_feedback_codes_match_score_feedback():
+    words = [''.join(letters) for letters in product('abc', repeat=5)]
+    expected = [[encode_feedback(score_feedback(guess, answer)) for answer in words] for guess in words]
+
+    assert [[feedback_code(guess, answer) for answer in words] for guess in words] == expected
+
+    pytest.importorskip('numpy')
+    from wordle_core.patterns import _encode_letters, pattern_codes
+    letters = _encode_letters(words)
+    assert pattern_codes(letters, letters).tolist() == expected
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_numpy_ranking_matches_python(seed, monkeypatch):
+    pytest.importorskip('numpy')
+    from wordle_core import ranking
+    pool = _random_words(seed, 500, 'aeirst')
+    rng = random.Random(seed)
+    words = rng.sample(pool, 200) + rng.sample(pool, 20)    # repeats keep their first position's prior
+    analysis = wordle_core.CandidateAnalysis(pool)
+    cases = [(pool, pool, None), (words, pool, None), (words, pool, analysis)]
+    top_ks = (None, 0, 1, 5, 64, len(words) - 1, len(pool) + 10)
+
+    def rank_all():
+        return [(ranking.RelevanceRanking(w, p, a)._total is not None, list(ranking.RelevanceRanking(w, p, a)),
+                 [ranking.rank_words_by_relevance(w, p, k, a) for k in top_ks]) for w, p, a in cases]
+
+    vectorized = rank_all()
+    monkeypatch.setattr(ranking, 'np', None)
+    reference = rank_all()
+    for (used_numpy, ranked, tops), (used_python, expected, expected_tops) in zip(vectorized, reference):
+        assert used_numpy and not used_python
+        assert ranked == expected
+        assert tops == expected_tops == [expected[:k] for k in top_ks]
+
+
+@pytest.mark.parametrize('guess, feedback', [('abcdefg', 'RRRRRRY'), ('abcdefg', 'RRRRY'), ('abcde', 'RRRRRRY')])
+def test_long_or_malformed_feedback(guess, feedback):
+    words = ['ghijklm', 'hijklmg', 'hijklmn', 'abcde', 'edcba']
+    expected = [word for word in words if CompiledConstraint(guess, feedback).matches(word)]
+    assert expected == (['ghijklm'] if len(guess) == len(feedback) else [])
+
+    assert filter_words([guess], [feedback], words) == expected
+    assert filter_words(['abcde', guess], ['RRRRR', feedback], words) == []
+    if wordle_core.NUMPY_VERSION is not None:
+        assert filter_words([guess], [feedback], words, backend='numpy') == expected
+
+    session = wordle_core.SolverSession(words)
+    session.add_guess(guess, feedback)
+    assert session.candidates == expected
+    assert session.constraint.usable == bool(expected)
+    if not expected:    # an unusable guess reveals nothing
+        assert not session.constraint.known and not session.constraint.present
+
+
+def test_opening_book_follows_the_word_list(tmp_path, monkeypatch):
+    words = _random_words(0, 300)
+    others = [word for word in words if 't' not in word]
+    path = str(tmp_path / 'opening_book.bin')
+    wordle_core.build_opening_book(words, depth=1).save(path)
+    monkeypatch.setenv('WORDLE_OPENING_BOOK', path)
+
+    for first, second in ((words, others), (others, words)):
+        for word_list in (first, second):
+            book = wordle_core.get_opening_book(word_list)
+            assert (book is not None) == (word_list is words)
+            assert wordle_core.suggest_for_history([], [], word_list, word_list) == \
+                wordle_core.suggest_next_guess(word_list, word_list)
+
+
+def test_suggestion_cache_keeps_bounded_searches_apart(monkeypatch):
+    from wordle_core import suggest
+    words = _random_words(1, 400)
+    candidates = filter_words(['aeilo'], ['RRRRR'], words)
+    cache = wordle_core.SuggestionCache()
+
+    monkeypatch.setattr(suggest, 'SLOW_PATH_CELLS', dict.fromkeys(suggest.SLOW_PATH_CELLS, 10 ** 9))
+    full = wordle_core.suggest_next_guess(candidates, words, cache=cache)
+    monkeypatch.setattr(suggest, 'SLOW_PATH_CELLS', dict.fromkeys(suggest.SLOW_PATH_CELLS, 1))
+    bounded = wordle_core.suggest_next_guess(candidates, words)
+    assert bounded != full
+    assert wordle_core.suggest_next_guess(candidates, words, cache=cache) == bounded
+    assert cache.hits == 0 and cache.misses == 2
+
+
+def test_sanitize_keeps_letters_of_any_alphabet():
+    words, report = wordle_core.sanitize_words(['Crème', 'äpfel', 'слово', 'crane', 'CRANE', 'cr4ne', "o'er!", 'cranes'])
+    assert words == ['crème', 'äpfel', 'слово', 'crane']
+    assert report.dropped == {'duplicate': 1, 'non_alpha': 2, 'wrong_length': 1}
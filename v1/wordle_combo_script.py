@@ -4,8 +4,14 @@ Enhanced Wordle Combinations Finder
 Determines possible 5-letter English words based on guesses with letter placement constraints
 """
 
-from collections import Counter
-from typing import List, Tuple
+import os
+import sys
+
+# The solver engine is the shared wordle_core package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from wordle_core import filter_words, sanitize_words, suggest_next_guess, validate_guess
+
 
 # Comprehensive list of common 5-letter English words
 WORD_LIST = [
@@ -69,101 +75,7 @@ WORD_LIST = [
     "woman", "women", "world", "worry", "worse", "worst", "worth", "would", "wound", "write",
     "wrong", "wrote", "yield", "young", "yours", "youth", "zones"
 ]
-
-
-def validate_guess(guess: str, feedback: str) -> Tuple[bool, str]:
-    """Validate that the guess and feedback are correctly formatted."""
-    if len(guess) != 5 or not guess.isalpha():
-        return False, "Guess must be a 5-letter word containing only letters."
-    if len(feedback) != 5 or not all(c in 'GYR' for c in feedback.upper()):
-        return False, "Feedback must be 5 characters, each 'G' (green), 'Y' (yellow), or 'R' (red)."
-    return True, ""
-
-
-def is_valid_word(word: str, guess: str, feedback: str) -> bool:
-    """
-    Check if a word is valid given a guess and its feedback.
-    
-    Rules:
-    - Green (G): Letter is in the correct position
-    - Yellow (Y): Letter exists in the word but wrong position
-    - Red (R): Letter doesn't exist in the word (or no more instances exist)
-    """
-    guess = guess.lower()
-    word = word.lower()
-    feedback = feedback.upper()
-    
-    # Count occurrences of each letter in guess by feedback type
-    green_positions = {}
-    yellow_letters = Counter()
-    red_letters = set()
-    
-    for i, (letter, fb) in enumerate(zip(guess, feedback)):
-        if fb == 'G':
-            green_positions[i] = letter
-            yellow_letters[letter] += 1
-        elif fb == 'Y':
-            yellow_letters[letter] += 1
-        elif fb == 'R':
-            red_letters.add(letter)
-    
-    # Check green constraints (correct position)
-    for pos, letter in green_positions.items():
-        if word[pos] != letter:
-            return False
-    
-    # Check yellow constraints (letter exists but wrong position)
-    word_counter = Counter(word)
-    for letter, min_count in yellow_letters.items():
-        if word_counter[letter] < min_count:
-            return False
-    
-    # Check that yellow letters aren't in their guessed positions
-    for i, (letter, fb) in enumerate(zip(guess, feedback)):
-        if fb == 'Y' and word[i] == letter:
-            return False
-    
-    # Check red constraints (letter shouldn't appear more than green/yellow count)
-    for letter in red_letters:
-        required_count = yellow_letters.get(letter, 0)
-        if word_counter[letter] > required_count:
-            return False
-    
-    return True
-
-
-def filter_words(guesses: List[str], feedbacks: List[str], word_list: List[str]) -> List[str]:
-    """Filter word list based on guesses and their feedbacks."""
-    possible_words = word_list.copy()
-    
-    for guess, feedback in zip(guesses, feedbacks):
-        possible_words = [
-            word for word in possible_words 
-            if is_valid_word(word, guess, feedback)
-        ]
-    
-    return possible_words
-
-
-def suggest_next_guess(possible_words: List[str]) -> List[str]:
-    """Suggest good next guesses based on letter frequency."""
-    if len(possible_words) <= 5:
-        return possible_words
-    
-    # Count letter frequency across all positions
-    letter_freq = Counter()
-    for word in possible_words:
-        letter_freq.update(set(word))  # Count each letter once per word
-    
-    # Score words by unique letter frequency
-    word_scores = []
-    for word in possible_words:
-        score = sum(letter_freq[letter] for letter in set(word))
-        word_scores.append((score, word))
-    
-    # Return top 5 suggestions
-    word_scores.sort(reverse=True)
-    return [word for _, word in word_scores[:5]]
+WORD_LIST = sanitize_words(WORD_LIST)[0]  # lowercase, 5 letters, no duplicates
 
 
 def main():
@@ -236,8 +148,8 @@ def main():
         
         # Show suggestions if there are many possibilities
         if len(possible_words) > 5:
-            print(f"\n💡 Suggested next guesses (best letter coverage):")
-            suggestions = suggest_next_guess(possible_words)
+            print(f"\n💡 Suggested next guesses (most informative):")
+            suggestions = suggest_next_guess(possible_words, WORD_LIST)
             for word in suggestions:
                 print(f"  → {word.upper()}")
     else:
@@ -0,0 +1,60 @@
+"""
+Wordle Solver Core
+The engine shared by every finder variant: word lists, feedback patterns,
+compiled constraints and candidate sets, letter analysis, ranking, guess
+suggestions and their cache.
+The finders are user interfaces on top of this API.
+
+Optional dependency: numpy speeds up pattern and bucket computations and
+enables the 'numpy' filter backend; everything works without it.
+"""
+
+from ._numpy import NUMPY_VERSION
+from .analysis import CandidateAnalysis
+from .cache import DEFAULT_SUGGESTION_CACHE, SUGGESTION_CACHE_VERSION, SuggestionCache
+from .constraints import (CompiledConstraint, MergedConstraint, NumpyWordIndex, SolverSession, WordIndex,
+                          filter_words, get_numpy_word_index, get_word_index, is_valid_word)
+from .feedback import (ALL_GREEN, PATTERN_DIGITS, decode_feedback, encode_feedback, feedback_code, pattern_words,
+                       score_feedback, validate_guess)
+from .patterns import (DEFAULT_PATTERN_MATRIX, PATTERN_MATRIX_MAGIC, PATTERN_MATRIX_VERSION, PatternMatrix,
+                       build_pattern_matrix, build_pattern_matrix_parallel, discard_pattern_matrix, get_pattern_matrix,
+                       pattern_codes, save_pattern_matrix)
+from .ranking import RelevanceRanking, iter_ranked_words, letter_statistics, rank_words_by_relevance
+from .suggest import (BUCKET_STRATEGIES, DEFAULT_OPENING_BOOK, OPENING_BOOK_MAGIC, OPENING_BOOK_VERSION,
+                      SUGGESTION_STRATEGIES, OpeningBook, bucket_scores, build_opening_book, get_opening_book,
+                      pattern_buckets, suggest_for_history, suggest_next_guess)
+from .timing import TIMINGS, StageTimer
+from .words import (DEFAULT_WORDLIST, WORD_CACHE_MAGIC, WORD_CACHE_SUFFIX, WORD_CACHE_VERSION, WORD_LENGTH,
+                    SanitizeReport, WordListCache, load_word_list, load_word_list_cache,
+                    normalize_word, parse_word_file, sanitize_words, write_word_cache)
+
+__all__ = [
+    # words
+    'DEFAULT_WORDLIST', 'WORD_CACHE_MAGIC', 'WORD_CACHE_SUFFIX', 'WORD_CACHE_VERSION', 'WORD_LENGTH',
+    'SanitizeReport', 'WordListCache', 'load_word_list', 'load_word_list_cache',
+    'normalize_word', 'parse_word_file', 'sanitize_words', 'write_word_cache',
+    # feedback
+    'ALL_GREEN', 'PATTERN_DIGITS', 'decode_feedback', 'encode_feedback', 'feedback_code', 'pattern_words',
+    'score_feedback', 'validate_guess',
+    # candidate analysis
+    'CandidateAnalysis',
+    # constraints and candidate sets
+    'CompiledConstraint', 'MergedConstraint', 'NumpyWordIndex', 'SolverSession', 'WordIndex',
+    'filter_words', 'get_numpy_word_index', 'get_word_index', 'is_valid_word',
+    # pattern matrix
+    'DEFAULT_PATTERN_MATRIX', 'PATTERN_MATRIX_MAGIC', 'PATTERN_MATRIX_VERSION', 'PatternMatrix',
+    'build_pattern_matrix', 'build_pattern_matrix_parallel', 'discard_pattern_matrix', 'get_pattern_matrix',
+    'pattern_codes', 'save_pattern_matrix',
+    # ranking
+    'RelevanceRanking', 'iter_ranked_words', 'letter_statistics', 'rank_words_by_relevance',
+    # suggestions
+    'BUCKET_STRATEGIES', 'DEFAULT_OPENING_BOOK', 'OPENING_BOOK_MAGIC', 'OPENING_BOOK_VERSION',
+    'SUGGESTION_STRATEGIES', 'OpeningBook', 'bucket_scores', 'build_opening_book', 'get_opening_book',
+    'pattern_buckets', 'suggest_for_history', 'suggest_next_guess',
+    # suggestion cache
+    'DEFAULT_SUGGESTION_CACHE', 'SUGGESTION_CACHE_VERSION', 'SuggestionCache',
+    # timings
+    'TIMINGS', 'StageTimer',
+    # optional numpy (version string, None when not installed)
+    'NUMPY_VERSION',
+]
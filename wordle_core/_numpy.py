@@ -0,0 +1,10 @@
+"""
+Optional numpy import for the Wordle solver core
+"""
+
+try:
+    import numpy as np  # Optional: only needed for the vectorized paths
+except ImportError:
+    np = None
+
+NUMPY_VERSION = np.__version__ if np is not None else None
@@ -0,0 +1,108 @@
+"""
+Letter analysis of a candidate list for the Wordle solver core
+"""
+
+from collections import Counter
+from itertools import chain
+from typing import Dict, List
+
+
+def _subtract(counter: Counter, delta: Counter):
+    """counter -= delta, dropping letters whose count falls to zero."""
+    for key, n in delta.items():
+        left = counter[key] - n
+        if left > 0:
+            counter[key] = left
+        else:
+            del counter[key]
+
+
+class CandidateAnalysis:
+    """
+    Letter frequencies of one candidate list, tallied once per turn and
+    shared by ranking, suggestions and statistics:
+
+      position_freq    five Counters: letter counts at each position
+      presence_freq    words containing each letter (counted once per word)
+      letter_freq      total occurrences of each letter
+      letter_counts    (letter, n) -> words with exactly n of that letter
+
+    narrowed() derives the analysis of a smaller candidate list by
+    subtracting the removed words, or by tallying the survivors when fewer
+    of them are left than were removed. Treat an analysis as read-only.
+    """
+
+    def __init__(self, words: List[str] = ()):
+        self.words = list(words)
+        self.position_freq = [Counter() for _ in range(5)]
+        self.presence_freq = Counter()
+        self.letter_freq = Counter()
+        self.letter_counts = Counter()
+        self._tally(self.words)
+
+    def _tally(self, words: List[str]):
+        for pos, counter in enumerate(self.position_freq):
+            counter.update(word[pos] for word in words if len(word) > pos)
+        self.letter_freq.update(chain.from_iterable(words))
+        self.letter_counts.update((letter, word.count(letter)) for word in words for letter in set(word))
+        for (letter, _), n in self.letter_counts.items():
+            self.presence_freq[letter] += n
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def copy(self) -> 'CandidateAnalysis':
+        other = CandidateAnalysis()
+        other.words = list(self.words)
+        other.position_freq = [counter.copy() for counter in self.position_freq]
+        other.presence_freq = self.presence_freq.copy()
+        other.letter_freq = self.letter_freq.copy()
+        other.letter_counts = self.letter_counts.copy()
+        return other
+
+    def narrowed(self, words: List[str]) -> 'CandidateAnalysis':
+        """The analysis of words, a sub-list of this analysis' words."""
+        keep = set(words)
+        removed = [word for word in self.words if word not in keep]
+        if len(words) <= len(removed):
+            return CandidateAnalysis(words)
+
+        other = self.copy()
+        delta = CandidateAnalysis(removed)
+        for counter, counts in zip(other.position_freq, delta.position_freq):
+            _subtract(counter, counts)
+        _subtract(other.presence_freq, delta.presence_freq)
+        _subtract(other.letter_freq, delta.letter_freq)
+        _subtract(other.letter_counts, delta.letter_counts)
+        other.words = list(words)
+        return other
+
+    @property
+    def first_letter_freq(self) -> Counter:
+        """How many words start with each letter."""
+        return self.position_freq[0]
+
+    def letter_histogram(self, letter: str) -> Dict[int, int]:
+        """Number of words containing letter exactly n times, keyed by n."""
+        return {n: words for (l, n), words in sorted(self.letter_counts.items()) if l == letter}
+
+    @staticmethod
+    def _most_common(counter: Counter, letters, n: int) -> List[str]:
+        # Ties go to the letter seen first in letters, as with Counter.most_common
+        # on a fresh tally; scanning stops once every counted letter has been seen
+        first_seen = {}
+        for letter in letters:
+            if letter not in first_seen:
+                first_seen[letter] = len(first_seen)
+                if len(first_seen) == len(counter):
+                    break
+        ranked = sorted(counter.items(), key=lambda item: (-item[1], first_seen.get(item[0], len(first_seen))))
+        return [letter for letter, _ in ranked[:n]]
+
+    def most_common_letters(self, n: int = 5) -> List[str]:
+        """The n letters occurring most often overall, most frequent first."""
+        return self._most_common(self.letter_freq, chain.from_iterable(self.words), n)
+
+    def most_common_first_letters(self, n: int = 3) -> List[str]:
+        """The n most common first letters, most frequent first."""
+        return self._most_common(self.first_letter_freq, (word[0] for word in self.words if word), n)
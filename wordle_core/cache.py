@@ -0,0 +1,143 @@
+"""
+Suggestion cache for the Wordle solver core
+"""
+
+from collections import OrderedDict
+from typing import List, Optional
+import hashlib
+import os
+import sqlite3
+import sys
+
+SUGGESTION_CACHE_VERSION = 2
+MAX_DISK_ENTRIES = 100_000
+
+
+def _user_cache_dir() -> str:
+    """$XDG_CACHE_HOME (or %LOCALAPPDATA% on Windows, else ~/.cache)/lexicon_locksmith."""
+    base = os.environ.get('XDG_CACHE_HOME') or (os.name == 'nt' and os.environ.get('LOCALAPPDATA')) or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'lexicon_locksmith')
+
+
+DEFAULT_SUGGESTION_CACHE = os.path.join(_user_cache_dir(), 'suggestion_cache.sqlite')
+
+
+class SuggestionCache:
+    """
+    Suggestions keyed by canonical game state: a digest of the word list,
+    the candidate bitset, the strategy, top_k, the search budget (bounded
+    searches can rank differently from full ones) and (in hard mode) the
+    bitset of allowed guesses. Different guess orders that leave the same
+    candidates share an entry.
+
+    The most recently used entries are kept in memory (an LRU of maxsize
+    entries). Given a path, entries are also written to a SQLite file that
+    any number of processes can share; it keeps the newest max_disk_entries
+    entries and drops the oldest. hits (disk_hits of them read from the
+    file) and misses count lookups.
+    """
+
+    def __init__(self, path: str = None, maxsize: int = 4096, max_disk_entries: int = MAX_DISK_ENTRIES):
+        self.path = path
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._db = self._connect(path) if path else None
+
+    @staticmethod
+    def _connect(path: str):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')   # readers never wait for a writer
+            db.execute('CREATE TABLE IF NOT EXISTS suggestions (key TEXT PRIMARY KEY, words TEXT NOT NULL)')
+            return db
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠ Suggestion cache {path} unavailable, keeping it in memory only: {e}", file=sys.stderr)
+            return None
+
+    @staticmethod
+    def key(index, bits: int, strategy: str, top_k: Optional[int], pool_bits: int = None,
+            budget: Optional[int] = None) -> str:
+        """
+        The cache key for candidates bits (and hard-mode guesses pool_bits) over
+        a WordIndex, searched with a cell budget (None for a full search).
+        """
+        size = (len(index.words) + 7) // 8
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f'{SUGGESTION_CACHE_VERSION}|{index.checksum}|{len(index.words)}|{strategy}|{top_k}|'
+                      f'{budget}|'.encode())
+        digest.update(bits.to_bytes(size, 'little'))
+        if pool_bits is not None:
+            digest.update(b'|hard|')
+            digest.update(pool_bits.to_bytes(size, 'little'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Cached suggestions for key, or None."""
+        words = self._memory.get(key)
+        if words is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return list(words)
+
+        if self._db is not None:
+            try:
+                row = self._db.execute('SELECT words FROM suggestions WHERE key = ?', (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                words = tuple(row[0].split('\n')) if row[0] else ()
+                self._remember(key, words)
+                self.hits += 1
+                self.disk_hits += 1
+                return list(words)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, words: List[str]):
+        """Store suggestions under key, in memory and on disk."""
+        words = tuple(words)
+        self._remember(key, words)
+        if self._db is not None:
+            try:
+                # A replaced row gets a new rowid, so rowids run from oldest to newest write
+                cursor = self._db.execute('INSERT OR REPLACE INTO suggestions (key, words) VALUES (?, ?)',
+                                          (key, '\n'.join(words)))
+                self._db.execute('DELETE FROM suggestions WHERE rowid <= ?',
+                                 (cursor.lastrowid - self.max_disk_entries,))
+            except sqlite3.Error as e:
+                print(f"⚠ Not writing to suggestion cache {self.path}: {e}", file=sys.stderr)
+                self._db = None
+
+    def _remember(self, key: str, words: tuple):
+        self._memory[key] = words
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def clear(self):
+        """Drop every entry, including the ones on disk, and reset the counters."""
+        self._memory.clear()
+        self.hits = self.disk_hits = self.misses = 0
+        if self._db is not None:
+            self._db.execute('DELETE FROM suggestions')
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def summary(self) -> str:
+        """The hit/miss counters as one line."""
+        lookups = self.hits + self.misses
+        rate = f" ({self.hits / lookups:.0%} hit rate)" if lookups else ""
+        return f"{self.hits} hits ({self.disk_hits} from disk), {self.misses} misses{rate}"
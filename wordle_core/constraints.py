@@ -0,0 +1,478 @@
+"""
+Constraints and candidate sets for the Wordle solver core
+Compiled per-guess constraints, bitset and numpy word indexes, filtering
+and the undoable solver session
+"""
+
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import zlib
+
+from ._numpy import np
+from .analysis import CandidateAnalysis
+
+
+class CompiledConstraint:
+    """
+    A guess and its feedback compiled once into the checks a word must pass.
+
+    Building the green, yellow and letter-count rules is the expensive part of
+    is_valid_word, so filter_words compiles each guess once and reuses it for
+    every word in the list. Only words as long as the guess can match, and a
+    feedback of a different length makes the constraint unusable: it matches
+    nothing.
+    """
+
+    __slots__ = ('guess', 'feedback', 'length', 'usable', 'greens', 'yellows', 'min_counts', 'max_counts')
+
+    def __init__(self, guess: str, feedback: str):
+        guess = guess.lower()
+        feedback = feedback.upper()
+        self.guess = guess
+        self.feedback = feedback
+        self.length = len(guess)
+        self.usable = len(guess) == len(feedback)
+
+        # position -> letter pairs for G, and (position, letter) pairs for Y
+        self.greens = tuple((i, letter) for i, (letter, fb) in enumerate(zip(guess, feedback)) if fb == 'G')
+        self.yellows = tuple((i, letter) for i, (letter, fb) in enumerate(zip(guess, feedback)) if fb == 'Y')
+
+        # Minimum required count for each letter marked G or Y
+        min_counts = Counter(letter for letter, fb in zip(guess, feedback) if fb in ('G', 'Y'))
+        self.min_counts = tuple(min_counts.items())
+
+        # Maximum allowed count when a letter is also marked R.
+        # A letter marked only R gets a maximum of 0, i.e. it is excluded.
+        self.max_counts = tuple(
+            (letter, min_counts[letter])
+            for letter in sorted(set(guess))
+            if any(l == letter and fb == 'R' for l, fb in zip(guess, feedback))
+        )
+
+    def matches(self, word: str) -> bool:
+        """Check a single word against the compiled constraint."""
+        if not self.usable or (self.length is not None and len(word) != self.length):
+            return False
+        word = word.lower()
+        for pos, letter in self.greens:
+            if word[pos] != letter:
+                return False
+        for pos, letter in self.yellows:
+            if word[pos] == letter:
+                return False
+        for letter, min_count in self.min_counts:
+            if word.count(letter) < min_count:
+                return False
+        for letter, max_count in self.max_counts:
+            if word.count(letter) > max_count:
+                return False
+        return True
+
+    def filter(self, words: List[str]) -> List[str]:
+        """Return the words that satisfy the constraint, preserving order."""
+        if not self.usable:
+            return []
+        matches = self.matches
+        return [word for word in words if matches(word)]
+
+
+class MergedConstraint(CompiledConstraint):
+    """
+    Every guess/feedback pair of a game folded into one canonical constraint.
+
+    Greens and yellow bans are unioned, minimum counts take the highest and
+    maximum counts the lowest value seen, so a single pass (or a single
+    bitset/mask step) applies the whole history. It also carries the known
+    pattern, must-contain and cannot-contain letters for display.
+    extended() folds in one more guess without replaying the history.
+    Guesses of different lengths make it unusable; with no guesses at all it
+    has no length and matches every word.
+    """
+
+    __slots__ = ('guesses', 'feedbacks', 'known', 'banned', 'present', 'excluded', '_min', '_max')
+
+    def __init__(self, guesses: List[str], feedbacks: List[str]):
+        self.usable = True
+        self.length = None
+        self.known = {}                           # position -> letter (latest G wins)
+        self.banned = {}                          # position -> letters marked Y there
+        self.greens = ()
+        self._min = {}                            # letter -> highest minimum count
+        self._max = {}                            # letter -> lowest maximum count
+
+        for guess, feedback in zip(guesses, feedbacks):
+            self._fold(guess, feedback)
+        self.guesses = tuple(guesses)
+        self.feedbacks = tuple(feedbacks)
+        self._finish()
+
+    def extended(self, guess: str, feedback: str) -> 'MergedConstraint':
+        """This constraint with one more guess folded in (self is left unchanged)."""
+        merged = MergedConstraint.__new__(MergedConstraint)
+        merged.usable = self.usable
+        merged.length = self.length
+        merged.known = dict(self.known)
+        merged.banned = {pos: set(letters) for pos, letters in self.banned.items()}
+        merged.greens = self.greens
+        merged._min = dict(self._min)
+        merged._max = dict(self._max)
+        merged._fold(guess, feedback)
+        merged.guesses = self.guesses + (guess,)
+        merged.feedbacks = self.feedbacks + (feedback,)
+        merged._finish()
+        return merged
+
+    def _fold(self, guess: str, feedback: str):
+        constraint = CompiledConstraint(guess, feedback)
+        if not constraint.usable or self.length not in (None, constraint.length):
+            self.usable = False
+            return
+        self.length = constraint.length
+        greens = list(self.greens)
+        for pos, letter in constraint.greens:
+            if (pos, letter) not in greens:
+                greens.append((pos, letter))
+            self.known[pos] = letter
+        self.greens = tuple(greens)
+        for pos, letter in constraint.yellows:
+            self.banned.setdefault(pos, set()).add(letter)
+        for letter, count in constraint.min_counts:
+            self._min[letter] = max(count, self._min.get(letter, 0))
+        for letter, count in constraint.max_counts:
+            self._max[letter] = min(count, self._max.get(letter, count))
+
+    def _finish(self):
+        self.yellows = tuple((pos, letter) for pos in sorted(self.banned) for letter in sorted(self.banned[pos]))
+        self.min_counts = tuple(sorted(self._min.items()))
+        self.max_counts = tuple(sorted(self._max.items()))
+        self.present = {letter for letters in self.banned.values() for letter in letters}
+        self.excluded = {letter for letter, count in self._max.items() if count == 0}
+
+
+class WordIndex:
+    """
+    Positional inverted index over a word list, stored as integer bitsets.
+
+    Bit i of every bitset stands for words[i]. There is one bitset per
+    (position, letter) and one per (letter, k) meaning "contains the letter
+    at least k times", so applying a compiled constraint is a few AND /
+    AND-NOT operations instead of a Python loop over the words.
+    """
+
+    def __init__(self, words: List[str]):
+        self.words = list(words)
+        self.all_bits = (1 << len(self.words)) - 1
+        self.checksum = zlib.crc32('\n'.join(self.words).encode('utf-8'))
+        self._positions_of = None   # word -> index, built on first bits_from_words()
+
+        size = (len(self.words) + 7) // 8
+        positions = []                       # position -> letter -> bytearray
+        at_least = {}                        # letter -> k -> bytearray
+        lengths = {}                         # word length -> bytearray
+
+        for i, word in enumerate(self.words):
+            word = word.lower()
+            byte, bit = i >> 3, 1 << (i & 7)
+            lengths.setdefault(len(word), bytearray(size))[byte] |= bit
+            while len(positions) < len(word):
+                positions.append({})
+            for pos, letter in enumerate(word):
+                positions[pos].setdefault(letter, bytearray(size))[byte] |= bit
+            for letter, count in Counter(word).items():
+                levels = at_least.setdefault(letter, {})
+                for k in range(1, count + 1):
+                    levels.setdefault(k, bytearray(size))[byte] |= bit
+
+        # A constraint only matches words as long as its guess
+        self.length_bits = {length: int.from_bytes(bits, 'little') for length, bits in lengths.items()}
+        self.positions = [
+            {letter: int.from_bytes(bits, 'little') for letter, bits in table.items()}
+            for table in positions
+        ]
+        self.at_least = {
+            letter: {k: int.from_bytes(bits, 'little') for k, bits in levels.items()}
+            for letter, levels in at_least.items()
+        }
+
+    def constraint_bits(self, constraint: CompiledConstraint, bits: int = None) -> int:
+        """Narrow a candidate bitset (all words by default) by one constraint."""
+        if not constraint.usable:
+            return 0
+        if bits is None:
+            bits = self.all_bits
+        if constraint.length is not None:
+            bits &= self.length_bits.get(constraint.length, 0)
+            if not bits:
+                return 0
+        for pos, letter in constraint.greens:
+            bits &= self.positions[pos].get(letter, 0)
+        for pos, letter in constraint.yellows:
+            bits &= ~self.positions[pos].get(letter, 0)
+        for letter, min_count in constraint.min_counts:
+            bits &= self.at_least.get(letter, {}).get(min_count, 0)
+        for letter, max_count in constraint.max_counts:
+            bits &= ~self.at_least.get(letter, {}).get(max_count + 1, 0)
+        return bits
+
+    def hard_mode_bits(self, constraint: CompiledConstraint) -> int:
+        """
+        Words Wordle's hard mode accepts as the next guess: every revealed
+        green kept in place and every revealed letter reused at least as
+        often as it was revealed.
+        """
+        bits = self.all_bits
+        if constraint.length is not None:
+            bits &= self.length_bits.get(constraint.length, 0)
+            if not bits:
+                return 0
+        for pos, letter in constraint.greens:
+            bits &= self.positions[pos].get(letter, 0)
+        for letter, min_count in constraint.min_counts:
+            bits &= self.at_least.get(letter, {}).get(min_count, 0)
+        return bits
+
+    def filter_bits(self, guesses: List[str], feedbacks: List[str], bits: int = None) -> int:
+        """Apply every guess/feedback pair and return the surviving bitset."""
+        return self.constraint_bits(MergedConstraint(guesses, feedbacks), bits)
+
+    @staticmethod
+    def count(bits: int) -> int:
+        """Number of candidates in a bitset."""
+        return bin(bits).count('1')
+
+    def bits_from_words(self, words: List[str]) -> Optional[int]:
+        """Encode words as a bitset, or None if any of them is not in the index."""
+        if self._positions_of is None:
+            self._positions_of = {}
+            for i, word in enumerate(self.words):
+                self._positions_of.setdefault(word, i)
+        positions_of = self._positions_of
+        flags = bytearray((len(self.words) + 7) // 8)
+        for word in words:
+            i = positions_of.get(word)
+            if i is None:
+                return None
+            flags[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(flags, 'little')
+
+    def words_from_bits(self, bits: int) -> List[str]:
+        """Decode a bitset back to words, in word-list order."""
+        flags = format(bits, 'b')[::-1]
+        words = self.words
+        result = []
+        i = flags.find('1')
+        while i != -1:
+            result.append(words[i])
+            i = flags.find('1', i + 1)
+        return result
+
+
+@lru_cache(maxsize=4)
+def _cached_word_index(words: Tuple[str, ...]) -> WordIndex:
+    return WordIndex(words)
+
+
+def get_word_index(word_list: List[str]) -> WordIndex:
+    """Return the (cached) bitset index for a word list."""
+    return _cached_word_index(tuple(word_list))
+
+
+class NumpyWordIndex:
+    """
+    Vectorized filtering backend for large dictionaries (requires numpy).
+
+    Words are stored as an N x L matrix of letter codes (0 pads shorter words)
+    plus an N x A matrix of per-word letter counts, where the alphabet is taken
+    from the corpus itself (26 columns for plain English lists). Every green,
+    yellow, min-count and max-count rule becomes a boolean mask over all rows,
+    after the rows are narrowed to words as long as the guess.
+    """
+
+    def __init__(self, words: List[str]):
+        if np is None:
+            raise ImportError("The numpy filter backend requires numpy (pip install numpy)")
+
+        self.words = list(words)
+        lowered = [word.lower() for word in self.words]
+        self.alphabet = sorted(set(''.join(lowered)))
+        self.codes = {letter: code for code, letter in enumerate(self.alphabet, start=1)}
+
+        dtype = np.uint8 if len(self.alphabet) < 256 else np.uint16
+        width = max([5] + [len(word) for word in lowered])
+        self.letters = np.zeros((len(lowered), width), dtype=dtype)
+
+        # Encode one word length at a time so the work stays in numpy
+        codepoints = np.array([ord(letter) for letter in self.alphabet], dtype=np.uint32)
+        by_length = {}
+        for row, word in enumerate(lowered):
+            by_length.setdefault(len(word), []).append(row)
+        for length, rows in by_length.items():
+            if length == 0:
+                continue
+            raw = ''.join(lowered[row] for row in rows).encode('utf-32-le')
+            chars = np.frombuffer(raw, dtype=np.uint32).reshape(len(rows), length)
+            self.letters[rows, :length] = np.searchsorted(codepoints, chars) + 1
+
+        counts = np.zeros((len(lowered), len(self.alphabet) + 1), dtype=np.uint8)
+        row_ids = np.arange(len(lowered))
+        for col in range(width):
+            counts[row_ids, self.letters[:, col]] += 1
+        self.counts = counts[:, 1:]
+        self.lengths = np.fromiter((len(word) for word in lowered), dtype=np.intp, count=len(lowered))
+
+    def constraint_mask(self, constraint: CompiledConstraint, mask=None):
+        """Narrow a boolean candidate mask (all words by default) by one constraint."""
+        if mask is None:
+            mask = np.ones(len(self.words), dtype=bool)
+        if not constraint.usable or (constraint.length or 0) > self.letters.shape[1]:
+            return np.zeros_like(mask)
+        if constraint.length is not None:
+            mask &= self.lengths == constraint.length
+        codes = self.codes
+        for pos, letter in constraint.greens:
+            if letter not in codes:
+                return np.zeros_like(mask)
+            mask &= self.letters[:, pos] == codes[letter]
+        for pos, letter in constraint.yellows:
+            if letter in codes:
+                mask &= self.letters[:, pos] != codes[letter]
+        for letter, min_count in constraint.min_counts:
+            if letter not in codes:
+                return np.zeros_like(mask)
+            mask &= self.counts[:, codes[letter] - 1] >= min_count
+        for letter, max_count in constraint.max_counts:
+            if letter in codes:
+                mask &= self.counts[:, codes[letter] - 1] <= max_count
+        return mask
+
+    def filter_mask(self, guesses: List[str], feedbacks: List[str], mask=None):
+        """Apply every guess/feedback pair and return the surviving mask."""
+        return self.constraint_mask(MergedConstraint(guesses, feedbacks), mask)
+
+    def words_from_mask(self, mask) -> List[str]:
+        """Decode a mask back to words, in word-list order."""
+        words = self.words
+        return [words[i] for i in np.flatnonzero(mask)]
+
+
+@lru_cache(maxsize=2)
+def _cached_numpy_word_index(words: Tuple[str, ...]) -> NumpyWordIndex:
+    return NumpyWordIndex(words)
+
+
+def get_numpy_word_index(word_list: List[str]) -> NumpyWordIndex:
+    """Return the (cached) numpy index for a word list."""
+    return _cached_numpy_word_index(tuple(word_list))
+
+
+def is_valid_word(word: str, guess: str, feedback: str) -> bool:
+    """
+    Check if a word is valid given a guess and its feedback.
+    
+    Enhanced version with proper handling of duplicate letters.
+    For filtering many words, compile the guess once with CompiledConstraint.
+    """
+    return CompiledConstraint(guess, feedback).matches(word)
+
+
+def filter_words(guesses: List[str], feedbacks: List[str], word_list: List[str],
+                 backend: str = 'bitset') -> List[str]:
+    """
+    Filter word list based on guesses and their feedbacks.
+    
+    backend is 'bitset' (default, pure Python) or 'numpy' for very large lists.
+    """
+    if backend not in ('bitset', 'numpy'):
+        raise ValueError(f"Unknown filter backend: {backend!r}")
+    
+    if not guesses:
+        return word_list.copy()
+    
+    if backend == 'numpy':
+        index = get_numpy_word_index(word_list)
+        return index.words_from_mask(index.filter_mask(guesses, feedbacks))
+    
+    index = get_word_index(word_list)
+    return index.words_from_bits(index.filter_bits(guesses, feedbacks))
+
+
+class SolverSession:
+    """
+    Guess history plus the current candidate set for one interactive game.
+
+    Each new guess narrows the existing candidate bitset with a single
+    compiled constraint rather than replaying the whole history against
+    the full word list. Every turn keeps a snapshot of its bitset, its
+    MergedConstraint (extended by one guess per turn, shared by the pattern
+    display and hard mode) and, once built, the decoded word list and
+    letter analysis, so undo and redo just step back and forth through
+    those snapshots.
+    """
+
+    def __init__(self, word_list: List[str]):
+        self.word_list = word_list
+        self.index = get_word_index(word_list)
+        self.guesses = []
+        self.feedbacks = []
+        # snapshots[i] is [bits, candidates, analysis, constraint] after the first i guesses
+        self._snapshots = [[self.index.all_bits, None, None, MergedConstraint([], [])]]
+        self._redo = []   # (guess, feedback, snapshot) entries undone most recently last
+
+    def add_guess(self, guess: str, feedback: str):
+        """Record a guess and narrow the candidates by it."""
+        bits = self.index.constraint_bits(CompiledConstraint(guess, feedback), self.bits)
+        self.guesses.append(guess)
+        self.feedbacks.append(feedback)
+        self._snapshots.append([bits, None, None, self.constraint.extended(guess, feedback)])
+        self._redo.clear()
+
+    def undo(self) -> Tuple[str, str]:
+        """Remove the last guess and return it as (guess, feedback)."""
+        guess = self.guesses.pop()
+        feedback = self.feedbacks.pop()
+        self._redo.append((guess, feedback, self._snapshots.pop()))
+        return guess, feedback
+
+    def redo(self) -> Tuple[str, str]:
+        """Re-apply the most recently undone guess and return it."""
+        guess, feedback, snapshot = self._redo.pop()
+        self.guesses.append(guess)
+        self.feedbacks.append(feedback)
+        self._snapshots.append(snapshot)
+        return guess, feedback
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def constraint(self) -> MergedConstraint:
+        """Every guess so far merged into one constraint."""
+        return self._snapshots[-1][3]
+
+    @property
+    def bits(self) -> int:
+        """Bitset of the current candidates."""
+        return self._snapshots[-1][0]
+
+    @property
+    def candidates(self) -> List[str]:
+        """Words still consistent with every guess, in word-list order."""
+        snapshot = self._snapshots[-1]
+        if snapshot[1] is None:
+            snapshot[1] = self.index.words_from_bits(snapshot[0])
+        return snapshot[1]
+
+    @property
+    def analysis(self) -> CandidateAnalysis:
+        """
+        Letter analysis of the current candidates, narrowed from the most
+        recent earlier turn that has one instead of tallied from scratch.
+        """
+        snapshot = self._snapshots[-1]
+        if snapshot[2] is None:
+            earlier = next((s[2] for s in reversed(self._snapshots[:-1]) if s[2] is not None), None)
+            candidates = self.candidates
+            snapshot[2] = earlier.narrowed(candidates) if earlier else CandidateAnalysis(candidates)
+        return snapshot[2]
@@ -0,0 +1,92 @@
+"""
+Feedback patterns for the Wordle solver core
+Validating, scoring and encoding G/Y/R feedback
+"""
+
+from collections import Counter
+from typing import List, Tuple
+
+
+def validate_guess(guess: str, feedback: str) -> Tuple[bool, str]:
+    """Validate that the guess and feedback are correctly formatted."""
+    if not guess or not feedback:
+        return False, "Guess and feedback cannot be empty."
+    if len(guess) != 5 or not guess.isalpha():
+        return False, "Guess must be a 5-letter word containing only letters."
+    if len(feedback) != 5:
+        return False, f"Feedback must be 5 characters long (got {len(feedback)})."
+    if not all(c in 'GYR' for c in feedback.upper()):
+        return False, "Feedback must contain only 'G' (correct), 'Y' (present), or 'R' (absent)."
+    return True, ""
+
+
+# Feedback patterns: G/Y/R strings encoded as base-3 integers (R=0, Y=1, G=2),
+# first letter most significant, so every 5-letter pattern fits in 0..242.
+PATTERN_DIGITS = {'R': 0, 'Y': 1, 'G': 2}
+ALL_GREEN = 242
+
+
+def score_feedback(guess: str, answer: str) -> str:
+    """
+    Compute the G/Y/R feedback Wordle shows for a guess against an answer.
+    
+    Greens are assigned first; each remaining guess letter is Yellow only
+    while unmatched copies of it are left in the answer, so duplicate
+    letters are scored the way the game does.
+    """
+    guess = guess.lower()
+    answer = answer.lower()
+    result = ['R'] * len(guess)
+    unmatched = Counter()
+    
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            result[i] = 'G'
+        else:
+            unmatched[a] += 1
+    
+    for i, g in enumerate(guess):
+        if result[i] != 'G' and unmatched[g] > 0:
+            result[i] = 'Y'
+            unmatched[g] -= 1
+    
+    return ''.join(result)
+
+
+def encode_feedback(feedback: str) -> int:
+    """Encode a G/Y/R feedback string as its base-3 pattern code."""
+    code = 0
+    for fb in feedback.upper():
+        code = code * 3 + PATTERN_DIGITS[fb]
+    return code
+
+
+def decode_feedback(code: int, length: int = 5) -> str:
+    """Decode a base-3 pattern code back to its G/Y/R feedback string."""
+    letters = []
+    for _ in range(length):
+        code, digit = divmod(code, 3)
+        letters.append('RYG'[digit])
+    return ''.join(reversed(letters))
+
+
+def feedback_code(guess: str, answer: str) -> int:
+    """Pattern code of score_feedback(guess, answer), computed without building strings."""
+    guess = guess.lower()
+    answer = answer.lower()
+    unmatched = [a for g, a in zip(guess, answer) if g != a]
+    code = 0
+    for g, a in zip(guess, answer):
+        if g == a:
+            code = code * 3 + 2
+        elif g in unmatched:
+            unmatched.remove(g)
+            code = code * 3 + 1
+        else:
+            code *= 3
+    return code
+
+
+def pattern_words(word_list: List[str]) -> List[str]:
+    """Unique lowercase 5-letter words of a list, in first-seen order (pattern matrix rows)."""
+    return list(dict.fromkeys(w.lower() for w in word_list if len(w) == 5 and w.isalpha()))
@@ -0,0 +1,297 @@
+"""
+Pattern matrix for the Wordle solver core
+Feedback codes for every (guess, answer) pair, computed on the fly or
+precomputed, saved to disk and read back through mmap
+"""
+
+from array import array
+from typing import List, Tuple
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+from ._numpy import np
+from .feedback import feedback_code, pattern_words
+
+
+def _pattern_rows_python(words: List[str], rows: range) -> bytearray:
+    out = bytearray(len(rows) * len(words))
+    offset = 0
+    for g in rows:
+        guess = words[g]
+        for answer in words:
+            out[offset] = feedback_code(guess, answer)
+            offset += 1
+    return out
+
+
+def _encode_letters(words: List[str]):
+    """N x 5 array of code points for a list of 5-letter words."""
+    return np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32).reshape(len(words), 5)
+
+
+_PATTERN_WEIGHTS = [81, 27, 9, 3, 1]
+_BLOCK_CELLS = 2_000_000   # guess x answer cells handled per numpy block
+
+
+def pattern_codes(guess_letters, answer_letters):
+    """
+    Vectorized feedback codes for a block of guesses against a block of answers.
+    
+    Takes the arrays from _encode_letters and returns a G x K uint8 array
+    matching feedback_code for every pair (requires numpy).
+    """
+    green = guess_letters[:, None, :] == answer_letters[None, :, :]
+    open_letters = ~green
+    codes = np.zeros(green.shape[:2], dtype=np.uint8)
+    yellows = []
+    
+    for i, weight in enumerate(_PATTERN_WEIGHTS):
+        # Unmatched copies of guess letter i in each answer, minus those
+        # already claimed by yellows of the same letter earlier in the guess
+        same = (guess_letters[:, None, i, None] == answer_letters[None, :, :]) & open_letters
+        unmatched = same.sum(axis=2, dtype=np.uint8)
+        for j in range(i):
+            unmatched -= yellows[j] & (guess_letters[:, j] == guess_letters[:, i])[:, None]
+        yellow = open_letters[:, :, i] & (unmatched > 0)
+        yellows.append(yellow)
+        codes += green[:, :, i] * np.uint8(2 * weight) + yellow * np.uint8(weight)
+    
+    return codes
+
+
+def _pattern_rows_numpy(words: List[str], rows: range) -> bytearray:
+    letters = _encode_letters(words)
+    out = np.empty((len(rows), len(words)), dtype=np.uint8)
+    step = max(1, _BLOCK_CELLS // max(1, len(words)))
+    for start in range(0, len(rows), step):
+        block = rows[start:start + step]
+        out[start:start + len(block)] = pattern_codes(letters[block.start:block.stop:block.step], letters)
+    return bytearray(out.tobytes())
+
+
+def build_pattern_matrix(words: List[str], rows: range = None) -> bytearray:
+    """
+    Precompute feedback codes for every (guess, answer) pair of a word list.
+    
+    Returns a row-major bytearray where byte [g * N + a] is
+    feedback_code(words[g], words[a]). Uses numpy when it is installed.
+    Pass rows to build only a slice of guess rows.
+    """
+    if any(len(word) != 5 for word in words):
+        raise ValueError("Pattern matrix words must all be 5 letters (see pattern_words)")
+    if rows is None:
+        rows = range(len(words))
+    if np is not None:
+        return _pattern_rows_numpy(words, rows)
+    return _pattern_rows_python(words, rows)
+
+
+_pattern_worker_state = {}
+
+
+def _init_pattern_worker(shm_name: str, words: List[str]):
+    from multiprocessing import shared_memory
+    _pattern_worker_state['shm'] = shared_memory.SharedMemory(name=shm_name)
+    _pattern_worker_state['words'] = words
+
+
+def _pattern_worker(bounds: Tuple[int, int]) -> int:
+    start, stop = bounds
+    words = _pattern_worker_state['words']
+    size = len(words)
+    _pattern_worker_state['shm'].buf[start * size:stop * size] = build_pattern_matrix(words, range(start, stop))
+    return stop - start
+
+
+def build_pattern_matrix_parallel(words: List[str], processes: int = None, chunk_rows: int = 64,
+                                  progress=None) -> bytearray:
+    """
+    build_pattern_matrix split across a process pool.
+    
+    Guess rows are handed out in chunks; each worker writes its rows straight
+    into one multiprocessing.shared_memory buffer, so only row ranges and
+    row counts cross process boundaries. progress(rows_done, total) is
+    called as chunks finish. Python before 3.8 has no shared_memory, so
+    the matrix is built in this process there.
+    """
+    from multiprocessing import Pool
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        shared_memory = None
+    
+    size = len(words)
+    if any(len(word) != 5 for word in words):
+        raise ValueError("Pattern matrix words must all be 5 letters (see pattern_words)")
+    if processes == 1 or size == 0 or shared_memory is None:
+        return build_pattern_matrix(words)
+    
+    shm = shared_memory.SharedMemory(create=True, size=size * size)
+    try:
+        chunks = [(start, min(start + chunk_rows, size)) for start in range(0, size, chunk_rows)]
+        done = 0
+        with Pool(processes, initializer=_init_pattern_worker, initargs=(shm.name, words)) as pool:
+            for rows in pool.imap_unordered(_pattern_worker, chunks):
+                done += rows
+                if progress is not None:
+                    progress(done, size)
+        return bytearray(shm.buf[:size * size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Pattern matrix file layout (little-endian), version 1:
+#   header   magic, version, word count, words size, matrix offset,
+#            CRC32 of the words block, CRC32 of the row-checksum table
+#   words    newline-separated UTF-8
+#   row CRCs one CRC32 per guess row
+#   matrix   N x N codes, starting on a page boundary so rows can be mmapped
+PATTERN_MATRIX_MAGIC = b'LLPM'
+PATTERN_MATRIX_VERSION = 1
+_PATTERN_HEADER = struct.Struct('<4sHHIIQII')
+_PAGE_SIZE = 4096
+DEFAULT_PATTERN_MATRIX = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pattern_matrix.bin')
+
+
+def save_pattern_matrix(path: str, words: List[str], matrix: bytes):
+    """Write words and their pattern matrix to a versioned, checksummed binary file."""
+    count = len(words)
+    if len(matrix) != count * count:
+        raise ValueError(f"Matrix has {len(matrix)} bytes, expected {count * count}")
+    
+    words_block = '\n'.join(words).encode('utf-8')
+    view = memoryview(matrix)
+    row_crcs = array('I', (zlib.crc32(view[r * count:(r + 1) * count]) for r in range(count)))
+    if sys.byteorder != 'little':
+        row_crcs.byteswap()
+    crc_block = row_crcs.tobytes()
+    
+    body = _PATTERN_HEADER.size + len(words_block) + len(crc_block)
+    matrix_offset = -(-body // _PAGE_SIZE) * _PAGE_SIZE
+    
+    with open(path, 'wb') as f:
+        f.write(_PATTERN_HEADER.pack(PATTERN_MATRIX_MAGIC, PATTERN_MATRIX_VERSION, 0, count,
+                                     len(words_block), matrix_offset,
+                                     zlib.crc32(words_block), zlib.crc32(crc_block)))
+        f.write(words_block)
+        f.write(crc_block)
+        f.write(b'\0' * (matrix_offset - body))
+        f.write(matrix)
+
+
+class PatternMatrix:
+    """
+    Read-only, memory-mapped view of a pattern matrix file.
+
+    Opening reads and checks only the header, word list and row checksums.
+    The matrix itself is mapped with mmap, so the OS pages in just the rows
+    that are touched and every process mapping the same file shares them
+    through the page cache. Each row's checksum is verified on first use.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            raw = f.read(_PATTERN_HEADER.size)
+            if len(raw) < _PATTERN_HEADER.size:
+                raise ValueError(f"{path} is not a pattern matrix file")
+            magic, version, _, count, words_size, offset, words_crc, crcs_crc = _PATTERN_HEADER.unpack(raw)
+            if magic != PATTERN_MATRIX_MAGIC:
+                raise ValueError(f"{path} is not a pattern matrix file")
+            if version != PATTERN_MATRIX_VERSION:
+                raise ValueError(f"{path} has unsupported version {version}")
+            
+            words_block = f.read(words_size)
+            crc_block = f.read(count * 4)
+            if zlib.crc32(words_block) != words_crc or zlib.crc32(crc_block) != crcs_crc:
+                raise ValueError(f"{path} failed its header checksum")
+            
+            self.words = words_block.decode('utf-8').split('\n') if count else []
+            self.row_crcs = array('I')
+            self.row_crcs.frombytes(crc_block)
+            if sys.byteorder != 'little':
+                self.row_crcs.byteswap()
+            
+            if os.fstat(f.fileno()).st_size < offset + count * count:
+                raise ValueError(f"{path} is truncated")
+            self._mmap = mmap.mmap(f.fileno(), offset + count * count, access=mmap.ACCESS_READ) if count else None
+        
+        self.size = count
+        self.offset = offset
+        self.rows = {word: i for i, word in enumerate(self.words)}
+        self._verified = set()
+
+    def row(self, guess_row: int) -> memoryview:
+        """Codes of one guess against every answer (verified on first access)."""
+        start = self.offset + guess_row * self.size
+        view = memoryview(self._mmap)[start:start + self.size]
+        if guess_row not in self._verified:
+            if zlib.crc32(view) != self.row_crcs[guess_row]:
+                raise ValueError(f"{self.path}: checksum mismatch in row {guess_row}")
+            self._verified.add(guess_row)
+        return view
+
+    def codes(self, guess_rows: List[int], answer_cols: List[int]):
+        """Numpy block of codes for some guess rows and answer columns."""
+        for r in guess_rows:
+            if r not in self._verified:
+                self.row(r)
+        full = np.frombuffer(self._mmap, dtype=np.uint8, count=self.size * self.size,
+                             offset=self.offset).reshape(self.size, self.size)
+        return full[np.ix_(guess_rows, answer_cols)]
+
+    def code(self, guess: str, answer: str) -> int:
+        """Pattern code for a (guess, answer) pair of matrix words."""
+        return self.row(self.rows[guess])[self.rows[answer]]
+
+    def verify(self) -> bool:
+        """Check every row checksum (reads the whole matrix)."""
+        try:
+            for r in range(self.size):
+                self.row(r)
+        except ValueError:
+            return False
+        return True
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+_pattern_matrices = {}
+
+
+def get_pattern_matrix(word_list: List[str], path: str = None):
+    """
+    Lazily open the pattern matrix for a word list.
+    
+    Looks at path, then $WORDLE_PATTERN_MATRIX, then pattern_matrix.bin in
+    this package. Returns None when no usable file matches the word list,
+    so callers can fall back to scoring on the fly.
+    """
+    path = path or os.environ.get('WORDLE_PATTERN_MATRIX') or DEFAULT_PATTERN_MATRIX
+    if path not in _pattern_matrices:
+        matrix = None
+        if os.path.exists(path):
+            try:
+                matrix = PatternMatrix(path)
+            except (OSError, ValueError) as e:
+                print(f"⚠ Ignoring pattern matrix {path}: {e}", file=sys.stderr)
+        _pattern_matrices[path] = matrix
+    
+    matrix = _pattern_matrices[path]
+    if matrix is not None and matrix.words != pattern_words(word_list):
+        return None
+    return matrix
+
+
+def discard_pattern_matrix(matrix: PatternMatrix):
+    """Stop using a matrix found to be corrupt; later lookups score on the fly."""
+    for path, cached in _pattern_matrices.items():
+        if cached is matrix:
+            _pattern_matrices[path] = None
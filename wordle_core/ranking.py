@@ -0,0 +1,192 @@
+"""
+Candidate ranking for the Wordle solver core
+"""
+
+from typing import Iterator, List
+import heapq
+import re
+
+from ._numpy import np
+from .analysis import CandidateAnalysis
+
+
+_NUMPY_MIN_WORDS = 64    # below this the pure-Python scorer is faster
+_KEY_WEIGHTS = [26 ** 4, 26 ** 3, 26 ** 2, 26, 1]
+_LOWERCASE_ASCII = re.compile(r'[a-z]+')
+
+
+def _numpy_letters(words: List[str]):
+    """N x 5 letter codes (0-25), or None unless every word is five letters a-z."""
+    if np is None or len(words) < _NUMPY_MIN_WORDS or set(map(len, words)) != {5}:
+        return None
+    text = ''.join(words)
+    if not _LOWERCASE_ASCII.fullmatch(text):
+        return None
+    return (np.frombuffer(text.encode('ascii'), dtype=np.uint8).reshape(len(words), 5) - 97).astype(np.intp)
+
+
+def _presence(letters):
+    """N x 26 boolean matrix: does word i contain letter j."""
+    presence = np.zeros((len(letters), 26), dtype=bool)
+    presence[np.arange(len(letters))[:, None], letters] = True
+    return presence
+
+
+def _pool_tables(pool_letters):
+    """Frequency tables over the pool: 5 x 26 positional counts and per-letter presence counts."""
+    position_freq = np.stack([np.bincount(pool_letters[:, pos], minlength=26) for pos in range(5)])
+    return position_freq, _presence(pool_letters).sum(axis=0)
+
+
+def _analysis_tables(analysis: CandidateAnalysis):
+    """The same tables read from a CandidateAnalysis."""
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    position_freq = np.array([[counter[letter] for letter in alphabet] for counter in analysis.position_freq],
+                             dtype=np.intp)
+    return position_freq, np.array([analysis.presence_freq[letter] for letter in alphabet], dtype=np.intp)
+
+
+def _relevance_scores_numpy(letters, position_freq, overall_freq):
+    """Scores and word keys (for tie-breaks) as numpy arrays."""
+    presence = _presence(letters)
+
+    # Words as base-26 integers: equal words share a key, and keys sort like the words
+    keys = letters @ np.array(_KEY_WEIGHTS, dtype=np.intp)
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    prior = 1000 - first[inverse.ravel()]      # commonality: earlier in the list is better
+
+    position_score = position_freq[np.arange(5), letters].sum(axis=1)
+    letter_score = presence.astype(np.intp) @ overall_freq
+    unique_bonus = presence.sum(axis=1) * 10
+    # Same operation order as the pure-Python scorer so the floats are identical
+    total = (position_score * 2) + letter_score + (prior * 0.1) + unique_bonus
+    return total, keys
+
+
+def _relevance_scores_python(words: List[str], analysis: CandidateAnalysis) -> List[float]:
+    # Positional letter frequencies, and overall frequencies counting each letter once per word
+    position_freq = analysis.position_freq
+    overall_freq = analysis.presence_freq
+    
+    # Position of each word's first occurrence
+    first_index = {}
+    for i, word in enumerate(words):
+        first_index.setdefault(word, i)
+    
+    scores = []
+    for word in words:
+        # Score based on positional frequency (how common each letter is in each position)
+        position_score = sum(position_freq[i][letter] for i, letter in enumerate(word))
+        
+        # Score based on overall letter frequency
+        letter_score = sum(overall_freq[letter] for letter in set(word))
+        
+        # Bonus for common English words (words that appear earlier in dictionary tend to be more common)
+        # This is a proxy - you could replace with actual word frequency data
+        commonality_bonus = 1000 - first_index[word]
+        
+        # Bonus for words with more unique letters (better information gain for future guesses)
+        unique_bonus = len(set(word)) * 10
+        
+        # Combined score (weighted)
+        scores.append((position_score * 2) + letter_score + (commonality_bonus * 0.1) + unique_bonus)
+    return scores
+
+
+class RelevanceRanking:
+    """
+    Relevance scores for one candidate list, computed once.
+
+    top(k) selects the k best words without sorting the rest (a heap, or a
+    numpy partition), and iterating yields the whole ranking lazily in
+    growing batches, so showing a screenful never pays for a full sort.
+    Highest score comes first; ties go to the word later in the alphabet.
+    Pass the pool's CandidateAnalysis when one is at hand to skip tallying it.
+    """
+
+    FIRST_BATCH = 64
+
+    def __init__(self, words: List[str], all_possible_words: List[str], analysis: CandidateAnalysis = None):
+        self.words = words
+        self._total = None
+        letters = _numpy_letters(words)
+        if letters is not None:
+            if analysis is not None:
+                tables = _analysis_tables(analysis)
+            else:
+                pool_letters = letters if all_possible_words is words else _numpy_letters(all_possible_words)
+                tables = _pool_tables(pool_letters) if pool_letters is not None else None
+            if tables is not None:
+                self._total, self._keys = _relevance_scores_numpy(letters, *tables)
+                return
+        if analysis is None:
+            analysis = CandidateAnalysis(all_possible_words)
+        self._scored = list(zip(_relevance_scores_python(words, analysis), words))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def top(self, k: int = None) -> List[str]:
+        """The k most relevant words, best first (all of them when k is None)."""
+        n = len(self.words)
+        if k is None or k >= n:
+            k = n
+        if k <= 0:
+            return []
+
+        if self._total is None:
+            if k == n:
+                return [word for _, word in sorted(self._scored, reverse=True)]
+            return [word for _, word in heapq.nlargest(k, self._scored)]
+
+        total, keys = self._total, self._keys
+        if k == n:
+            order = np.lexsort((keys, total))[::-1]
+        else:
+            # Everything above the k-th best score is in; ties at it are settled by the word key
+            threshold = np.partition(total, n - k)[n - k]
+            picked = np.flatnonzero(total >= threshold)
+            order = picked[np.lexsort((keys[picked], total[picked]))[::-1][:k]]
+        words = self.words
+        return [words[i] for i in order.tolist()]
+
+    def __iter__(self) -> Iterator[str]:
+        shown, k = 0, self.FIRST_BATCH
+        while shown < len(self.words):
+            batch = self.top(k)
+            yield from batch[shown:]
+            shown, k = len(batch), k * 4
+
+
+def rank_words_by_relevance(words: List[str], all_possible_words: List[str], top_k: int = None,
+                            analysis: CandidateAnalysis = None) -> List[str]:
+    """
+    Rank words by relevance using multiple scoring factors.
+    Returns words sorted from most to least likely (only the top_k best
+    when top_k is given, selected without sorting the rest).
+    
+    Scores positional and overall letter frequency across all_possible_words,
+    a commonality prior from list order and a unique-letter bonus. Large
+    lists of plain five-letter words are scored as numpy array operations;
+    both paths give the same order. analysis is all_possible_words'
+    CandidateAnalysis, when the caller already has it.
+    """
+    if len(words) <= 1:
+        return words if top_k is None else words[:top_k]
+    return RelevanceRanking(words, all_possible_words, analysis).top(top_k)
+
+
+def iter_ranked_words(words: List[str], all_possible_words: List[str]) -> Iterator[str]:
+    """Lazily yield words from most to least relevant; stop early to skip the rest of the sort."""
+    return iter(RelevanceRanking(words, all_possible_words))
+
+
+def letter_statistics(possible_words: List[str], letters: int = 5, first_letters: int = 3,
+                      analysis: CandidateAnalysis = None):
+    """
+    The most common letters across the remaining words and the most common
+    first letters, most frequent first.
+    """
+    if analysis is None:
+        analysis = CandidateAnalysis(possible_words)
+    return analysis.most_common_letters(letters), analysis.most_common_first_letters(first_letters)
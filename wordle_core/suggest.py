@@ -0,0 +1,451 @@
+"""
+Guess suggestions for the Wordle solver core
+Bucket-based strategies (entropy, minimax, expected size), the letter
+frequency heuristic and the precomputed opening book
+"""
+
+from collections import Counter
+from itertools import chain
+from math import log2
+from operator import itemgetter
+from typing import List, Optional
+import heapq
+import os
+import struct
+import sys
+import zlib
+
+from ._numpy import np
+from .analysis import CandidateAnalysis
+from .cache import SuggestionCache
+from .constraints import CompiledConstraint, MergedConstraint, WordIndex, get_word_index
+from .feedback import ALL_GREEN, decode_feedback, encode_feedback, feedback_code, pattern_words
+from .patterns import _BLOCK_CELLS, _encode_letters, discard_pattern_matrix, get_pattern_matrix, pattern_codes
+
+
+def pattern_buckets(guesses: List[str], candidates: List[str], all_words: List[str]):
+    """
+    Bucket the candidates by the feedback pattern each guess would produce.
+    
+    Returns a G x 243 numpy array of bucket sizes when numpy is installed,
+    otherwise one list of non-empty bucket sizes per guess. Codes come from
+    the on-disk pattern matrix when one matches all_words, and are scored
+    on the fly otherwise (also when a matrix row fails its checksum).
+    """
+    matrix = get_pattern_matrix(all_words)
+    if matrix is not None and not all(w in matrix.rows for w in chain(guesses, candidates)):
+        matrix = None
+    if matrix is not None:
+        try:
+            return _pattern_buckets(guesses, candidates, matrix)
+        except ValueError as e:
+            print(f"⚠ Ignoring corrupt pattern matrix, scoring on the fly: {e}", file=sys.stderr)
+            discard_pattern_matrix(matrix)
+    return _pattern_buckets(guesses, candidates, None)
+
+
+def _pattern_buckets(guesses: List[str], candidates: List[str], matrix):
+    if matrix is not None:
+        guess_rows = [matrix.rows[w] for w in guesses]
+        answer_cols = [matrix.rows[w] for w in candidates]
+    
+    if np is not None:
+        counts = np.zeros((len(guesses), 243), dtype=np.int64)
+        if not candidates:
+            return counts
+        if matrix is None:
+            guess_letters = _encode_letters(guesses)
+            answer_letters = _encode_letters(candidates)
+        step = max(1, _BLOCK_CELLS // len(candidates))
+        for start in range(0, len(guesses), step):
+            stop = min(start + step, len(guesses))
+            if matrix is not None:
+                codes = matrix.codes(guess_rows[start:stop], answer_cols)
+            else:
+                codes = pattern_codes(guess_letters[start:stop], answer_letters)
+            offsets = codes + 243 * np.arange(stop - start)[:, None]
+            counts[start:stop] = np.bincount(offsets.ravel(), minlength=243 * (stop - start)).reshape(-1, 243)
+        return counts
+    
+    buckets = []
+    if matrix is not None:
+        gather = itemgetter(*answer_cols) if len(answer_cols) > 1 else (lambda row: tuple(row[c] for c in answer_cols))
+        for r in guess_rows:
+            buckets.append(list(Counter(gather(matrix.row(r))).values()))
+    else:
+        for guess in guesses:
+            buckets.append(list(Counter(feedback_code(guess, answer) for answer in candidates).values()))
+    return buckets
+
+
+def bucket_scores(buckets, total: int, strategy: str = 'entropy') -> List[float]:
+    """
+    Score each guess's pattern buckets (higher is better).
+    
+    'entropy'  - expected information gain in bits over the candidates
+    'minimax'  - minus the largest bucket (worst-case candidates left)
+    'expected' - minus the expected number of candidates left
+    """
+    if strategy not in BUCKET_STRATEGIES:
+        raise ValueError(f"Unknown suggestion strategy: {strategy!r}")
+    if not total:
+        return [0.0] * len(buckets)
+    
+    if np is not None and isinstance(buckets, np.ndarray):
+        if strategy == 'minimax':
+            scores = (-buckets.max(axis=1)).tolist()
+        elif strategy == 'expected':
+            scores = (-(buckets * buckets).sum(axis=1) / total).tolist()
+        else:
+            p = buckets / total
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = (-np.where(p > 0, p * np.log2(p), 0.0).sum(axis=1)).tolist()
+    elif strategy == 'minimax':
+        scores = [-max(sizes, default=0) for sizes in buckets]
+    elif strategy == 'expected':
+        scores = [-sum(c * c for c in sizes) / total for sizes in buckets]
+    else:
+        scores = [-sum(c / total * log2(c / total) for c in sizes) for sizes in buckets]
+    
+    # Round away float noise so ties break the same way on every code path
+    return [round(score, 9) for score in scores]
+
+
+BUCKET_STRATEGIES = ('entropy', 'minimax', 'expected')
+SUGGESTION_STRATEGIES = BUCKET_STRATEGIES + ('frequency',)
+
+# Guess x candidate cells a bucket strategy scores per suggestion when numpy
+# or a matching pattern matrix is missing. Bigger searches only score the
+# guesses the letter-frequency heuristic rates best, so a suggestion stays
+# well under a second on every backend; numpy plus the matrix is unbounded.
+SLOW_PATH_CELLS = {'python': 300_000, 'numpy': 4_000_000, 'matrix': 8_000_000}
+MIN_BOUNDED_GUESSES = 50
+
+
+def suggest_next_guess(possible_words: List[str], all_words: List[str], strategy: str = 'entropy',
+                       hard_mode: bool = False, constraint: MergedConstraint = None, top_k: int = 5,
+                       analysis: CandidateAnalysis = None, cache: SuggestionCache = None,
+                       bits: int = None) -> List[str]:
+    """
+    Suggest good next guesses.
+    
+    'entropy' (default) scores every dictionary word by the expected
+    information its feedback would give over the remaining candidates.
+    'minimax' minimizes the worst-case and 'expected' the average number
+    of candidates left. All three share pattern_buckets and prefer words
+    that could still be the answer on ties. Without numpy and a pattern
+    matrix, large searches are cut down to the guesses with the best letter
+    frequencies (see SLOW_PATH_CELLS). 'frequency' is the original
+    positional-letter-frequency heuristic; it reads its tallies from
+    analysis (possible_words' CandidateAnalysis) when given.
+    
+    With hard_mode, only words that keep the hints revealed so far (the
+    game's MergedConstraint) are considered as guesses.
+    
+    With a cache, results are looked up and stored by game state and search
+    budget, so bounded results are never served to a full search. bits is
+    possible_words as a bitset over all_words (e.g. SolverSession.bits);
+    it is worked out from the words when not given.
+    
+    Returns the top_k best guesses (all of them, ranked, when top_k is None),
+    picked with a heap rather than a full sort.
+    """
+    if strategy not in SUGGESTION_STRATEGIES:
+        raise ValueError(f"Unknown suggestion strategy: {strategy!r}")
+    
+    if len(possible_words) <= 2:
+        return possible_words[:top_k]
+    
+    index = pool_bits = key = None
+    if hard_mode and constraint is not None:
+        index = get_word_index(all_words)
+        pool_bits = index.hard_mode_bits(constraint)
+    
+    if cache is not None:
+        index = index or get_word_index(all_words)
+        if bits is None:
+            bits = index.bits_from_words(possible_words)
+        if bits is not None:
+            budget = _search_budget(all_words) if strategy in BUCKET_STRATEGIES else None
+            key = cache.key(index, bits, strategy, top_k, pool_bits, budget)
+            suggestions = cache.get(key)
+            if suggestions is not None:
+                return suggestions
+    
+    guess_pool = all_words if pool_bits is None else index.words_from_bits(pool_bits)
+    suggestions = _suggest(possible_words, all_words, guess_pool, strategy, top_k, analysis)
+    if key is not None:
+        cache.put(key, suggestions)
+    return suggestions
+
+
+def _suggest(possible_words: List[str], all_words: List[str], guess_pool: List[str], strategy: str,
+             top_k: int, analysis: CandidateAnalysis) -> List[str]:
+    if strategy == 'frequency':
+        return _suggest_by_frequency(possible_words, guess_pool, top_k, analysis)
+    
+    candidates = pattern_words(possible_words)
+    guesses = _bound_guesses(pattern_words(guess_pool), candidates, all_words, analysis)
+    scores = bucket_scores(pattern_buckets(guesses, candidates, all_words), len(candidates), strategy)
+    
+    candidate_set = set(candidates)
+    return [guesses[i] for i in _select(range(len(guesses)), top_k,
+                                        key=lambda i: (-scores[i], guesses[i] not in candidate_set, i))]
+
+
+def _search_budget(all_words: List[str]) -> Optional[int]:
+    """Guess x candidate cells a bucket search may score on the available backend (None: no limit)."""
+    matrix = get_pattern_matrix(all_words)
+    if np is not None and matrix is not None:
+        return None
+    return SLOW_PATH_CELLS['matrix' if matrix is not None else 'numpy' if np is not None else 'python']
+
+
+def _bound_guesses(guesses: List[str], candidates: List[str], all_words: List[str],
+                   analysis: CandidateAnalysis) -> List[str]:
+    """The guesses worth scoring in full on the available backend, in their original order."""
+    budget = _search_budget(all_words)
+    if budget is None:
+        return guesses
+    limit = max(budget // max(len(candidates), 1), MIN_BOUNDED_GUESSES)
+    if len(guesses) <= limit:
+        return guesses
+    
+    if analysis is None or analysis.words != candidates:
+        analysis = CandidateAnalysis(candidates)
+    scores = [_frequency_score(word, analysis.position_freq) for word in guesses]
+    keep = heapq.nlargest(limit, range(len(guesses)), key=lambda i: (scores[i], -i))
+    return [guesses[i] for i in sorted(keep)]
+
+
+def _frequency_score(word: str, position_freq) -> float:
+    """Positional letter frequency of a guess, scaled down for repeated letters."""
+    position_score = sum(position_freq[i][letter] for i, letter in enumerate(word))
+    # Prefer words with unique letters for more information
+    return position_score * (len(set(word)) / 5)
+
+
+def _select(items, k: int, key):
+    """The k smallest items by key, in order: a heap for small k, a sort for everything."""
+    if k is None:
+        return sorted(items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+def _suggest_by_frequency(possible_words: List[str], all_words: List[str], top_k: int = 5,
+                          analysis: CandidateAnalysis = None) -> List[str]:
+    """Suggest guesses using letter frequency analysis."""
+    # If many possibilities remain, consider all words for maximum information gain
+    if len(possible_words) > 20:
+        search_space = all_words[:2000]  # Limit for performance
+    else:
+        search_space = possible_words
+    
+    # Score by positional letter frequency
+    if analysis is None:
+        analysis = CandidateAnalysis(possible_words)
+    position_freq = analysis.position_freq
+    
+    word_scores = []
+    for word in search_space:
+        if len(word) != 5:
+            continue
+        word_scores.append((_frequency_score(word, position_freq), word))
+    
+    if top_k is None:
+        word_scores.sort(reverse=True)
+    else:
+        word_scores = heapq.nlargest(top_k, word_scores)
+    return [word for _, word in word_scores]
+
+
+# Opening book file layout (little-endian), version 1:
+#   header  magic, version, depth, index width, CRC32 of the pattern words, node count
+#   strategy name (length-prefixed ASCII)
+#   nodes   preorder: suggestion count, suggestion word indices,
+#           child count, then (pattern code, child node) per child
+OPENING_BOOK_MAGIC = b'LLOB'
+OPENING_BOOK_VERSION = 1
+_BOOK_HEADER = struct.Struct('<4sHBBII')
+DEFAULT_OPENING_BOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+
+
+def _words_checksum(words: List[str]) -> int:
+    return zlib.crc32('\n'.join(words).encode('utf-8'))
+
+
+class OpeningBook:
+    """
+    Precomputed suggestion tree for the first turns of a game.
+
+    Each node holds the suggestions for one guess history; its children are
+    keyed by the pattern code seen after playing the node's top suggestion.
+    Looking up a history walks at most one node per guess.
+    """
+
+    def __init__(self, words: List[str], strategy: str, depth: int, root):
+        self.words = words
+        self.strategy = strategy
+        self.depth = depth
+        self.root = root   # (suggestions, {pattern code: child node})
+
+    def lookup(self, guesses: List[str], feedbacks: List[str]) -> List[str]:
+        """Suggestions for a guess history, or None when it leaves the book."""
+        node = self.root
+        for guess, feedback in zip(guesses, feedbacks):
+            suggestions, children = node
+            if not suggestions or guess.lower() != suggestions[0]:
+                return None
+            node = children.get(encode_feedback(feedback))
+            if node is None:
+                return None
+        return list(node[0])
+
+    def save(self, path: str):
+        """Write the book to a compact binary file."""
+        index = {word: i for i, word in enumerate(self.words)}
+        width = 2 if len(self.words) < 1 << 16 else 4
+        word_format = '<H' if width == 2 else '<I'
+        out = bytearray()
+        node_count = 0
+        
+        def write(node):
+            nonlocal node_count
+            node_count += 1
+            suggestions, children = node
+            out.append(len(suggestions))
+            for word in suggestions:
+                out.extend(struct.pack(word_format, index[word]))
+            out.append(len(children))
+            for code in sorted(children):
+                out.append(code)
+                write(children[code])
+        
+        write(self.root)
+        strategy = self.strategy.encode('ascii')
+        with open(path, 'wb') as f:
+            f.write(_BOOK_HEADER.pack(OPENING_BOOK_MAGIC, OPENING_BOOK_VERSION, self.depth, width,
+                                      _words_checksum(self.words), node_count))
+            f.write(bytes([len(strategy)]) + strategy)
+            f.write(out)
+
+    @classmethod
+    def load(cls, path: str, words: List[str]) -> 'OpeningBook':
+        """Read a book file built for the given pattern words."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < _BOOK_HEADER.size:
+            raise ValueError(f"{path} is not an opening book file")
+        magic, version, depth, width, checksum, _ = _BOOK_HEADER.unpack_from(data)
+        if magic != OPENING_BOOK_MAGIC:
+            raise ValueError(f"{path} is not an opening book file")
+        if version != OPENING_BOOK_VERSION:
+            raise ValueError(f"{path} has unsupported version {version}")
+        if checksum != _words_checksum(words):
+            raise ValueError(f"{path} was built for a different word list")
+        
+        pos = _BOOK_HEADER.size
+        strategy = data[pos + 1:pos + 1 + data[pos]].decode('ascii')
+        pos += 1 + data[pos]
+        word_format = '<H' if width == 2 else '<I'
+        
+        def read():
+            nonlocal pos
+            count = data[pos]
+            pos += 1
+            suggestions = []
+            for _ in range(count):
+                suggestions.append(words[struct.unpack_from(word_format, data, pos)[0]])
+                pos += width
+            children = {}
+            child_count = data[pos]
+            pos += 1
+            for _ in range(child_count):
+                code = data[pos]
+                pos += 1
+                children[code] = read()
+            return suggestions, children
+        
+        return cls(words, strategy, depth, read())
+
+
+def build_opening_book(word_list: List[str], strategy: str = 'entropy', depth: int = 3,
+                       progress=None) -> OpeningBook:
+    """
+    Solve the first turns of the game for a word list, greedily by strategy.
+    
+    Starting from the full list, the node's suggestions come from
+    suggest_next_guess; the top one is played against every feedback it can
+    produce, the candidates are narrowed exactly as the REPL narrows them,
+    and the process recurses until depth guesses deep or two candidates left.
+    """
+    words = pattern_words(word_list)
+    index = get_word_index(word_list)
+    
+    def solve(bits: int, level: int):
+        candidates = index.words_from_bits(bits)
+        suggestions = suggest_next_guess(candidates, word_list, strategy)
+        children = {}
+        if level + 1 < depth and len(suggestions) > 0 and len(candidates) > 2:
+            best = suggestions[0]
+            for code in sorted({feedback_code(best, answer) for answer in pattern_words(candidates)}):
+                if code == ALL_GREEN:
+                    continue
+                child_bits = index.constraint_bits(CompiledConstraint(best, decode_feedback(code)), bits)
+                if WordIndex.count(child_bits) > 2:
+                    children[code] = solve(child_bits, level + 1)
+            if progress is not None:
+                progress(level, best, len(children))
+        return suggestions, children
+    
+    return OpeningBook(words, strategy, depth, solve(index.all_bits, 0))
+
+
+_opening_books = {}
+
+
+def get_opening_book(word_list: List[str], path: str = None):
+    """
+    Lazily load the opening book for a word list.
+    
+    Looks at path, then $WORDLE_OPENING_BOOK, then opening_book.bin in this
+    package. Returns None when no usable book exists for this word list;
+    books are cached per (path, word list checksum).
+    """
+    path = path or os.environ.get('WORDLE_OPENING_BOOK') or DEFAULT_OPENING_BOOK
+    words = pattern_words(word_list)
+    key = (path, _words_checksum(words))
+    if key not in _opening_books:
+        book = None
+        if os.path.exists(path):
+            try:
+                book = OpeningBook.load(path, words)
+            except (OSError, ValueError, IndexError, struct.error) as e:
+                print(f"⚠ Ignoring opening book {path}: {e}", file=sys.stderr)
+        _opening_books[key] = book
+    return _opening_books[key]
+
+
+def suggest_for_history(guesses: List[str], feedbacks: List[str], possible_words: List[str],
+                        all_words: List[str], strategy: str = 'entropy', hard_mode: bool = False,
+                        top_k: int = 5, analysis: CandidateAnalysis = None, cache: SuggestionCache = None,
+                        bits: int = None, constraint: MergedConstraint = None) -> List[str]:
+    """
+    Suggestions from the opening book when the history is in it, else
+    suggest_next_guess (which gets analysis, cache and bits). The book is
+    built for normal mode, so hard mode always searches, and so does asking
+    for more suggestions than the book holds. Hard mode uses constraint, the
+    history's MergedConstraint (e.g. SolverSession.constraint), or builds it.
+    """
+    if hard_mode:
+        if constraint is None:
+            constraint = MergedConstraint(guesses, feedbacks)
+        return suggest_next_guess(possible_words, all_words, strategy, True, constraint, top_k, analysis, cache, bits)
+    
+    book = get_opening_book(all_words)
+    if book is not None and book.strategy == strategy and top_k is not None:
+        suggestions = book.lookup(guesses, feedbacks)
+        if suggestions is not None and len(suggestions) >= min(top_k, len(possible_words)):
+            return suggestions[:top_k]
+    return suggest_next_guess(possible_words, all_words, strategy, top_k=top_k, analysis=analysis, cache=cache,
+                              bits=bits)
@@ -0,0 +1,82 @@
+"""
+Stage timings for the Wordle solver core
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+import time
+
+
+def _no_color(key: str) -> str:
+    return ''
+
+
+class _NoTiming:
+    """Do-nothing context manager handed out while timings are off."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+class StageTimer:
+    """
+    Per-turn timings of the filter, analysis, ranking, suggestion,
+    statistics and rendering stages (enabled by --timings).
+
+    While disabled, stage() hands back one shared no-op context manager and
+    nothing is recorded. Nested stages are charged only their own time.
+    Front ends set color to their get_color() to style the printed report.
+    """
+
+    STAGES = ('filter', 'analysis', 'ranking', 'suggestion', 'statistics', 'rendering')
+    _off = _NoTiming()
+
+    def __init__(self):
+        self.enabled = False
+        self.turn = {}
+        self.totals = Counter()
+        self.turns = 0
+        self._children = []   # time spent in nested stages, per open stage
+        self.color = _no_color
+
+    def stage(self, name: str):
+        return self._timed(name) if self.enabled else self._off
+
+    @contextmanager
+    def _timed(self, name: str):
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            own = elapsed - self._children.pop()
+            self.turn[name] = self.turn.get(name, 0.0) + own
+            if self._children:
+                self._children[-1] += elapsed
+
+    def end_turn(self):
+        """Print this turn's stage times and add them to the totals."""
+        if not self.enabled or not self.turn:
+            return
+        self.turns += 1
+        self.totals.update(self.turn)
+        parts = [f"{name} {self.turn[name] * 1000:.1f}ms" for name in self.STAGES if name in self.turn]
+        print(f"{self.color('info')}⏱  {' | '.join(parts)}{self.color('reset')}")
+        self.turn = {}
+
+    def print_summary(self):
+        """Print total and per-turn average time for each stage."""
+        if not self.enabled or not self.turns:
+            return
+        print(f"\n{self.color('bold')}Stage timings over {self.turns} turn(s):{self.color('reset')}")
+        for name in self.STAGES:
+            if name in self.totals:
+                total = self.totals[name] * 1000
+                print(f"  {name:<11} total {total:9.1f}ms   avg {total / self.turns:8.1f}ms")
+
+
+TIMINGS = StageTimer()
@@ -0,0 +1,194 @@
+"""
+Word lists for the Wordle solver core
+The sanitizer, and loading word list files (the repository's wordlist.txt
+by default) through a binary cache
+"""
+
+from collections import Counter
+from typing import List, Tuple
+import os
+import re
+import struct
+import tempfile
+import unicodedata
+import zlib
+
+
+WORD_LENGTH = 5
+
+
+class SanitizeReport:
+    """What sanitize_words() kept and dropped, with a few examples of each drop reason."""
+
+    REASONS = ('duplicate', 'wrong_length', 'non_alpha')
+    MAX_EXAMPLES = 10
+
+    def __init__(self):
+        self.total = 0
+        self.kept = 0
+        self.normalized = 0
+        self.dropped = Counter()
+        self.examples = {reason: [] for reason in self.REASONS}
+
+    def drop(self, reason: str, word: str):
+        self.dropped[reason] += 1
+        if len(self.examples[reason]) < self.MAX_EXAMPLES:
+            self.examples[reason].append(word)
+
+    def lines(self) -> List[str]:
+        """The report as printable lines."""
+        lines = [f"{self.total} entries read, {self.kept} kept, {self.total - self.kept} dropped",
+                 f"  normalized (case/Unicode): {self.normalized}"]
+        for reason in self.REASONS:
+            count = self.dropped[reason]
+            examples = f" (e.g. {', '.join(self.examples[reason])})" if count else ""
+            lines.append(f"  {reason.replace('_', ' ')}: {count}{examples}")
+        return lines
+
+
+def normalize_word(word: str) -> str:
+    """NFKC-normalize, casefold and strip a raw word list entry."""
+    return unicodedata.normalize('NFKC', word).casefold().strip()
+
+
+def sanitize_words(words, length: int = WORD_LENGTH) -> Tuple[List[str], SanitizeReport]:
+    """
+    Clean a raw word list in one pass: normalize case and Unicode, drop
+    entries that are not exactly length letters (any alphabet, so accented
+    and non-Latin words are kept), and drop duplicates (keeping the first,
+    so list order still means commonality).
+    """
+    report = SanitizeReport()
+    seen = set()
+    clean = []
+    for raw in words:
+        report.total += 1
+        word = normalize_word(raw)
+        if word != raw:
+            report.normalized += 1
+        if not word.isalpha():
+            report.drop('non_alpha', raw)
+        elif len(word) != length:
+            report.drop('wrong_length', raw)
+        elif word in seen:
+            report.drop('duplicate', raw)
+        else:
+            seen.add(word)
+            clean.append(word)
+    report.kept = len(clean)
+    return clean, report
+
+
+# Word list files: wordlist.txt (quoted, comma-separated words) or any file
+# with one word per line. Parsed lists are sanitized and cached next to the
+# source file:
+#   header   magic, version, word width in bytes, word count,
+#            source size and mtime (to detect edits), CRC32 of the payload
+#   words    count x width bytes, UTF-8, zero-padded
+WORD_CACHE_MAGIC = b'LLWL'
+WORD_CACHE_VERSION = 4
+WORD_CACHE_SUFFIX = '.wlcache'
+_WORD_CACHE_HEADER = struct.Struct('<4sHHIQQI')
+DEFAULT_WORDLIST = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                 '..', 'wordlist.txt'))
+
+
+def parse_word_file(path: str) -> List[str]:
+    """Read words from a quoted list (like wordlist.txt) or a one-word-per-line file."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    quoted = re.findall(r'"([^"\n]*)"|\'([^\'\n]*)\'', text)
+    words = [a or b for a, b in quoted] if quoted else re.split(r'[\s,]+', text)
+    return [word.strip() for word in words if word.strip()]
+
+
+class WordListCache:
+    """A word list loaded from its binary cache (fixed-width words, no parsing)."""
+
+    def __init__(self, path: str, source_stat: os.stat_result = None):
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            magic, version, width, count, size, mtime, crc = _WORD_CACHE_HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError(f"{path} is not a word list cache")
+        if magic != WORD_CACHE_MAGIC or version != WORD_CACHE_VERSION:
+            raise ValueError(f"{path} is not a version {WORD_CACHE_VERSION} word list cache")
+        if source_stat is not None and (size, mtime) != (source_stat.st_size, source_stat.st_mtime_ns):
+            raise ValueError(f"{path} is out of date")
+        
+        payload = data[_WORD_CACHE_HEADER.size:]
+        if len(payload) != count * width or zlib.crc32(payload) != crc:
+            raise ValueError(f"{path} failed its checksum")
+        
+        if width == 5:
+            try:
+                text = payload.decode('ascii')
+            except UnicodeDecodeError:
+                text = None
+            if text is not None:
+                self.words = [text[i:i + 5] for i in range(0, len(text), 5)]
+                return
+        self.words = [payload[i:i + width].rstrip(b'\0').decode('utf-8') for i in range(0, len(payload), width)]
+
+
+def write_word_cache(path: str, words: List[str], source_stat: os.stat_result):
+    """Write the binary cache for a parsed word list."""
+    encoded = [word.encode('utf-8') for word in words]
+    width = max([5] + [len(word) for word in encoded])
+    payload = b''.join(word.ljust(width, b'\0') for word in encoded)
+    header = _WORD_CACHE_HEADER.pack(WORD_CACHE_MAGIC, WORD_CACHE_VERSION, width, len(words),
+                                     source_stat.st_size, source_stat.st_mtime_ns, zlib.crc32(payload))
+    
+    # Write a temporary file and rename it into place, so processes loading
+    # the list at the same time never see a partly written cache
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.tmp-',
+                                    suffix=WORD_CACHE_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_word_list_cache(path: str = None):
+    """
+    Load a word list file through its binary cache, rebuilding the cache
+    when it is missing or stale. Returns None when the file does not exist.
+    """
+    path = path or os.environ.get('WORDLE_WORDLIST') or DEFAULT_WORDLIST
+    if not os.path.exists(path):
+        return None
+    
+    source_stat = os.stat(path)
+    cache_path = path + WORD_CACHE_SUFFIX
+    try:
+        return WordListCache(cache_path, source_stat)
+    except (OSError, ValueError):
+        pass
+    
+    words, _ = sanitize_words(parse_word_file(path))
+    try:
+        write_word_cache(cache_path, words, source_stat)
+        return WordListCache(cache_path, source_stat)
+    except (OSError, ValueError):
+        # Read-only location, or the cache was replaced again meanwhile: parse every time instead
+        cache = WordListCache.__new__(WordListCache)
+        cache.words = words
+        return cache
+
+
+def load_word_list(path: str = None) -> List[str]:
+    """
+    The solver's dictionary, always sanitized: a word list file (path,
+    $WORDLE_WORDLIST or the repository's wordlist.txt) loaded through its
+    binary cache.
+    """
+    cache = load_word_list_cache(path)
+    if cache is None:
+        missing = path or os.environ.get('WORDLE_WORDLIST') or DEFAULT_WORDLIST
+        raise FileNotFoundError(f"Word list not found: {missing}")
+    return cache.words
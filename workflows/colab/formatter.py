@@ -1,91 +1,227 @@
 # Word List Formatter (Colab-friendly)
 
-from google.colab import files
+import heapq
+import os
+import sys
+import tempfile
+from collections import deque
+from itertools import groupby
 
-def format_wordlist(input_file, output_file="formatted_words.txt", words_per_line=10, alphabetize=True):
+# Words are held in memory until this budget is reached, then spilled to
+# sorted run files on disk and merged at the end (an external sort)
+DEFAULT_MEMORY_BUDGET_MB = 256
+_BYTES_PER_ENTRY = 100      # rough cost of one short str in a set/list
+MAX_MERGE_FANIN = 128       # run files merged at once
+WRITE_CHUNK_LINES = 1000    # output lines buffered per write
+
+
+def read_words(input_file, length=None):
+    """Stream normalized words from a file, skipping blanks and (optionally) other lengths."""
+    with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            word = line.strip().lower()
+            if word and (length is None or len(word) == length):
+                yield word
+
+
+def _write_run(lines, tmpdir):
+    fd, path = tempfile.mkstemp(dir=tmpdir, suffix='.run')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+    return path
+
+
+def _read_run(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield line[:-1]
+
+
+def _merge_runs(runs, tmpdir):
+    """Merge sorted run files, first in batches if there are too many to open at once."""
+    while len(runs) > MAX_MERGE_FANIN:
+        batch, runs = runs[:MAX_MERGE_FANIN], runs[MAX_MERGE_FANIN:]
+        runs.append(_write_run(heapq.merge(*(_read_run(path) for path in batch)), tmpdir))
+        for path in batch:
+            os.remove(path)
+    return heapq.merge(*(_read_run(path) for path in runs))
+
+
+def external_sorted(lines, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, tmpdir=None, unique=False):
+    """
+    Sort an iterable of strings using at most roughly memory_budget_mb of memory.
+
+    Fits in memory: a plain sort. Otherwise sorted runs are spilled to temporary
+    files and merged lazily. With unique=True, repeated strings are dropped.
+    Must be consumed inside tmpdir's lifetime when tmpdir is given.
+    """
+    budget = memory_budget_mb * 1024 * 1024
+    runs = []
+    buffer = set() if unique else []
+    used = 0
+
+    for line in lines:
+        if unique:
+            # A repeat of a buffered line takes no extra memory
+            if line in buffer:
+                continue
+            buffer.add(line)
+        else:
+            buffer.append(line)
+        used += len(line) + _BYTES_PER_ENTRY
+        if used >= budget:
+            runs.append(_write_run(sorted(buffer), tmpdir))
+            buffer.clear()
+            used = 0
+
+    if not runs:
+        merged = iter(sorted(buffer))
+    else:
+        if buffer:
+            runs.append(_write_run(sorted(buffer), tmpdir))
+            buffer.clear()
+        merged = _merge_runs(runs, tmpdir)
+
+    if unique:
+        return (line for line, _ in groupby(merged))
+    return merged
+
+
+def unique_words(words, alphabetize=True, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, tmpdir=None):
+    """
+    Lazily dedupe a stream of words within the memory budget.
+
+    alphabetize=True yields them sorted; otherwise in first-seen order, which
+    takes a second external sort keyed on each word's first position.
+    """
+    if alphabetize:
+        return external_sorted(words, memory_budget_mb, tmpdir, unique=True)
+
+    # Sort "word<TAB>position" so each word's first occurrence comes first,
+    # keep that one, then sort the survivors back into position order
+    by_word = external_sorted((f'{word}\t{i:012d}' for i, word in enumerate(words)), memory_budget_mb, tmpdir)
+    firsts = (next(group) for _, group in groupby(by_word, key=lambda line: line.rsplit('\t', 1)[0]))
+    positioned = ('{1}\t{0}'.format(*line.rsplit('\t', 1)) for line in firsts)
+    by_position = external_sorted(positioned, memory_budget_mb, tmpdir)
+    return (line.split('\t', 1)[1] for line in by_position)
+
+
+def write_formatted(words, out, words_per_line=10):
+    """
+    Write words to an open file as a Python list literal, a chunk of lines at a time.
+    Returns (count, first five words, last five words).
+    """
+    count = 0
+    first = []
+    last = deque(maxlen=5)
+    pending = None      # held back one line: only the last line has no trailing comma
+    chunk = ['[\n']
+    line = []
+
+    def flush_line():
+        nonlocal pending
+        formatted = ', '.join(f'"{word}"' for word in line)
+        if pending is not None:
+            chunk.append(f'    {pending},\n')
+        pending = formatted
+        line.clear()
+
+    for word in words:
+        count += 1
+        if len(first) < 5:
+            first.append(word)
+        last.append(word)
+        line.append(word)
+        if len(line) == words_per_line:
+            flush_line()
+            if len(chunk) >= WRITE_CHUNK_LINES:
+                out.writelines(chunk)
+                chunk.clear()
+    if line:
+        flush_line()
+    if pending is not None:
+        chunk.append(f'    {pending}\n')
+    chunk.append(']\n')
+    out.writelines(chunk)
+
+    return count, first, list(last)
+
+
+def format_wordlist(input_file, output_file="formatted_words.txt", words_per_line=10, alphabetize=True,
+                    length=None, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
     """
     Read words from input file and format them as a Python list.
-    
+
+    The input is streamed: words are filtered by length as they are read and
+    deduplicated with an external sort once they outgrow the memory budget,
+    so multi-GB dumps can be formatted in bounded memory.
+
     Args:
         input_file: Path to input text file (one word per line)
         output_file: Path to output file (default: formatted_words.txt)
         words_per_line: Number of words to display per line (default: 10)
         alphabetize: Whether to sort words alphabetically (default: True)
+        length: Only keep words of this length (default: keep all)
+        memory_budget_mb: Approximate memory to use before spilling to disk (default: 256)
     """
-    # Read all words from the file
-    with open(input_file, 'r') as f:
-        words = [line.strip() for line in f if line.strip()]
-    
-    # Remove duplicates and convert to lowercase
-    seen = set()
-    unique_words = []
-    for word in words:
-        if word.lower() not in seen:
-            seen.add(word.lower())
-            unique_words.append(word.lower())
-    
-    # Alphabetize if requested
-    if alphabetize:
-        unique_words.sort()
-    
-    # Format the output
-    formatted_lines = []
-    formatted_lines.append('[\n')
-    
-    for i in range(0, len(unique_words), words_per_line):
-        chunk = unique_words[i:i + words_per_line]
-        formatted_chunk = ', '.join(f'"{word}"' for word in chunk)
-        if i + words_per_line < len(unique_words):
-            formatted_lines.append(f'    {formatted_chunk},\n')
-        else:
-            formatted_lines.append(f'    {formatted_chunk}\n')
-    
-    formatted_lines.append(']\n')
-    
-    # Write to output file
-    with open(output_file, 'w') as f:
-        f.writelines(formatted_lines)
-    
-    print(f"✓ Formatted {len(unique_words)} unique words")
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_file))) as tmpdir:
+        words = unique_words(read_words(input_file, length), alphabetize, memory_budget_mb, tmpdir)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            count, first, last = write_formatted(words, f, words_per_line)
+
+    print(f"✓ Formatted {count} unique words")
     print(f"✓ Output saved to: {output_file}")
-    print(f"\nFirst few words: {', '.join(unique_words[:5])}")
-    print(f"Last few words: {', '.join(unique_words[-5:])}")
-    
+    print(f"\nFirst few words: {', '.join(first)}")
+    print(f"Last few words: {', '.join(last)}")
+
     return output_file
 
 
-def quick_format(input_file, alphabetize=True):
-    """Quick format that prints to console."""
-    with open(input_file, 'r') as f:
-        words = [line.strip().lower() for line in f if line.strip()]
-    
-    unique_words = list(dict.fromkeys(words))
-    
-    if alphabetize:
-        unique_words.sort()
-    
-    print('[')
-    for i in range(0, len(unique_words), 10):
-        chunk = unique_words[i:i + 10]
-        formatted = ', '.join(f'"{word}"' for word in chunk)
-        if i + 10 < len(unique_words):
-            print(f'    {formatted},')
-        else:
-            print(f'    {formatted}')
-    print(']')
-    
-    return unique_words
+def quick_format(input_file, alphabetize=True, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, stream=False):
+    """
+    Quick format that prints to console, deduplicated like format_wordlist.
+    Returns the list of unique words, or with stream=True only their count,
+    so the words never have to fit in memory at once.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        words = unique_words(read_words(input_file), alphabetize, memory_budget_mb, tmpdir)
+        if not stream:
+            words = list(words)
+        count, _, _ = write_formatted(words, sys.stdout)
+    return count if stream else words
 
 
 # --- Helper functions for Colab ---
 
+def _colab_files():
+    # Imported on first use so the formatter also runs outside Colab
+    from google.colab import files
+    return files
+
 def upload_wordlist():
     """Upload a wordlist file from your computer."""
-    uploaded = files.upload()
+    uploaded = _colab_files().upload()
     filename = list(uploaded.keys())[0]
     print(f"✓ Uploaded: {filename}")
     return filename
 
 def download_file(filepath):
     """Download a file from Colab to your computer."""
-    files.download(filepath)
+    _colab_files().download(filepath)
+
+
+if __name__ == "__main__" and 'google.colab' not in sys.modules:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Format a word list as a Python list literal.")
+    parser.add_argument('input_file', help="Text file with one word per line")
+    parser.add_argument('output_file', nargs='?', default="formatted_words.txt")
+    parser.add_argument('--words-per-line', type=int, default=10)
+    parser.add_argument('--keep-order', action='store_true', help="Keep first-seen order instead of sorting")
+    parser.add_argument('--length', type=int, help="Only keep words of this length")
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET_MB,
+                        help="Memory budget before spilling to disk (default: 256)")
+    args = parser.parse_args()
+    format_wordlist(args.input_file, args.output_file, args.words_per_line, not args.keep_order,
+                    args.length, args.memory_mb)